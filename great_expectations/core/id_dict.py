@@ -5,11 +5,26 @@ import json
 class IDDict(dict):
     _id_ignore_keys = set()
 
+    # Memoized result of "to_id()" with default arguments; every in-place modification of the dictionary clears it.
+    _id = None
+
     def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is None and id_ignore_keys is None:
+            if self._id is None:
+                self._id = self._compute_id(
+                    id_keys=self.keys(), id_ignore_keys=self._id_ignore_keys
+                )
+
+            return self._id
+
         if id_keys is None:
             id_keys = self.keys()
         if id_ignore_keys is None:
             id_ignore_keys = self._id_ignore_keys
+
+        return self._compute_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+
+    def _compute_id(self, id_keys, id_ignore_keys):
         id_keys = set(id_keys) - set(id_ignore_keys)
         if len(id_keys) == 0:
             return tuple()
@@ -22,6 +37,38 @@ class IDDict(dict):
             json.dumps(_id_dict, sort_keys=True).encode("utf-8")
         ).hexdigest()
 
+    def __setitem__(self, key, value):
+        self._id = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._id = None
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        self._id = None
+        super().clear()
+
+    def pop(self, *args):
+        self._id = None
+        return super().pop(*args)
+
+    def popitem(self):
+        self._id = None
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._id = None
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self._id = None
+        super().update(*args, **kwargs)
+
 
 class BatchKwargs(IDDict):
     pass
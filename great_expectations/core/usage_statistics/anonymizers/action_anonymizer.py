@@ -1,3 +1,5 @@
+from typing import Any, Dict, List
+
 from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
 from great_expectations.validation_operators import (
     MicrosoftTeamsNotificationAction,
@@ -42,3 +44,12 @@ class ActionAnonymizer(Anonymizer):
         )
 
         return anonymized_info_dict
+
+    def anonymize_action_info_list(self, actions: Dict[str, Any]) -> List[dict]:
+        """Anonymize every action of the given (action name -> action object) dictionary, preserving its order."""
+        action_name: str
+        action_obj: Any
+        return [
+            self.anonymize_action_info(action_name=action_name, action_obj=action_obj)
+            for action_name, action_obj in actions.items()
+        ]
@@ -1,6 +1,6 @@
 import logging
 from hashlib import md5
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from great_expectations.util import load_class
 
@@ -24,6 +24,12 @@ class Anonymizer:
         else:
             self._salt = salt
 
+        # Hash state after consuming the salt; anonymizing a string continues from (a copy of) this state.
+        self._salted_hash = md5(self._salt.encode("utf-8"))
+
+        # Recognized parent class names (None if not recognized) of classes previously checked against core GE classes.
+        self._parent_class_names_by_class: Dict[type, Optional[str]] = {}
+
     @property
     def salt(self) -> str:
         return self._salt
@@ -39,8 +45,9 @@ class Anonymizer:
             """
             )
 
-        salted = self._salt + string_
-        return md5(salted.encode("utf-8")).hexdigest()
+        salted_hash = self._salted_hash.copy()
+        salted_hash.update(string_.encode("utf-8"))
+        return salted_hash.hexdigest()
 
     def anonymize_object_info(
         self,
@@ -123,10 +130,12 @@ class Anonymizer:
         object_=None,
         object_class=None,
         object_config=None,
+        parent_class_names_by_class: Optional[Dict[type, Optional[str]]] = None,
     ) -> Optional[str]:
         """
         Check if the parent class is a subclass of any core GE class.
         This private method is intended to be used by anonymizers in a public `is_parent_class_recognized()` method. These anonymizers define and provide the core GE classes_to_check.
+        If provided, parent_class_names_by_class memoizes the results (it must only be used with the same classes_to_check).
         Returns:
             The name of the parent class found, or None if no parent class was found
         """
@@ -141,11 +150,23 @@ class Anonymizer:
                 object_module_name = object_config.get("module_name")
                 object_class = load_class(object_class_name, object_module_name)
 
+            if (
+                parent_class_names_by_class is not None
+                and object_class in parent_class_names_by_class
+            ):
+                return parent_class_names_by_class[object_class]
+
+            parent_class_name: Optional[str] = None
+
             for class_to_check in classes_to_check:
                 if issubclass(object_class, class_to_check):
-                    return class_to_check.__name__
+                    parent_class_name = class_to_check.__name__
+                    break
 
-            return None
+            if parent_class_names_by_class is not None:
+                parent_class_names_by_class[object_class] = parent_class_name
+
+            return parent_class_name
 
         except AttributeError:
             return None
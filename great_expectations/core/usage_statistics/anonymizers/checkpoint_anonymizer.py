@@ -33,4 +33,5 @@ class CheckpointAnonymizer(Anonymizer):
         return self._is_parent_class_recognized(
             classes_to_check=self._ge_classes,
             object_config=config,
+            parent_class_names_by_class=self._parent_class_names_by_class,
         )
@@ -77,4 +77,5 @@ class DataConnectorAnonymizer(Anonymizer):
         return self._is_parent_class_recognized(
             classes_to_check=self._ge_classes,
             object_config=config,
+            parent_class_names_by_class=self._parent_class_names_by_class,
         )
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional
 
 from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
 from great_expectations.core.usage_statistics.anonymizers.data_connector_anonymizer import (
@@ -37,6 +37,10 @@ class DatasourceAnonymizer(Anonymizer):
             BaseDatasource,
         ]
 
+        # Each list of classes to check requires its own memoized parent class names.
+        self._legacy_parent_class_names_by_class: Dict[type, Optional[str]] = {}
+        self._ge_parent_class_names_by_class: Dict[type, Optional[str]] = {}
+
         self._execution_engine_anonymizer = ExecutionEngineAnonymizer(salt=salt)
         self._data_connector_anonymizer = DataConnectorAnonymizer(salt=salt)
 
@@ -146,16 +150,19 @@ class DatasourceAnonymizer(Anonymizer):
         return self._is_parent_class_recognized(
             classes_to_check=self._ge_classes + self._legacy_ge_classes,
             object_config=config,
+            parent_class_names_by_class=self._parent_class_names_by_class,
         )
 
     def is_parent_class_recognized_v2_api(self, config) -> Optional[str]:
         return self._is_parent_class_recognized(
             classes_to_check=self._legacy_ge_classes,
             object_config=config,
+            parent_class_names_by_class=self._legacy_parent_class_names_by_class,
         )
 
     def is_parent_class_recognized_v3_api(self, config) -> Optional[str]:
         return self._is_parent_class_recognized(
             classes_to_check=self._ge_classes,
             object_config=config,
+            parent_class_names_by_class=self._ge_parent_class_names_by_class,
         )
@@ -52,5 +52,7 @@ class StoreAnonymizer(Anonymizer):
 
     def is_parent_class_recognized(self, store_obj):
         return self._is_parent_class_recognized(
-            classes_to_check=self._ge_classes, object_=store_obj
+            classes_to_check=self._ge_classes,
+            object_=store_obj,
+            parent_class_names_by_class=self._parent_class_names_by_class,
         )
@@ -36,11 +36,8 @@ class ValidationOperatorAnonymizer(Anonymizer):
         )
 
         if actions_dict:
-            anonymized_info_dict["anonymized_action_list"] = [
-                self._action_anonymizer.anonymize_action_info(
-                    action_name=action_name, action_obj=action_obj
-                )
-                for action_name, action_obj in actions_dict.items()
-            ]
+            anonymized_info_dict[
+                "anonymized_action_list"
+            ] = self._action_anonymizer.anonymize_action_info_list(actions=actions_dict)
 
         return anonymized_info_dict
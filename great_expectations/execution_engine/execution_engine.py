@@ -1,33 +1,48 @@
-import copy
 import logging
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
-
-import pandas as pd
-from ruamel.yaml import YAML
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchMarkers, BatchSpec
+
+# "MetricFunctionTypes" and "MetricPartialFunctionTypes" are defined in "great_expectations.core.metric_function_types",
+# so that the registry can use them without importing this module; they are re-exported here for existing importers.
+from great_expectations.core.metric_function_types import (  # noqa: F401
+    MetricFunctionTypes,
+    MetricPartialFunctionTypes,
+)
 from great_expectations.core.util import AzureUrl, DBFSPath, GCSUrl, S3Url
-from great_expectations.expectations.registry import get_metric_provider
-from great_expectations.util import filter_properties_dict
+from great_expectations.expectations.registry import (
+    _METRIC_FN_KIND_UNRECOGNIZED,
+    _get_metric_fn_kind,
+    get_metric_provider,
+)
+from great_expectations.util import is_numeric, is_truthy
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
-yaml = YAML()
-yaml.default_flow_style = False
-
-
-class NoOpDict:
-    def __getitem__(self, item):
-        return None
 
-    def __setitem__(self, key, value):
-        return None
-
-    def update(self, value):
-        return None
+_TABLE_DOMAIN_KWARGS_EXPECTED_KEYS: FrozenSet[str] = frozenset(
+    {
+        "batch_id",
+        "table",
+        "row_condition",
+        "condition_parser",
+    }
+)
 
 
 class BatchData:
@@ -40,14 +55,9 @@ class BatchData:
 
     def head(self, *args, **kwargs):
         # CONFLICT ON PURPOSE. REMOVE.
-        return pd.DataFrame({})
-
+        import pandas as pd
 
-class MetricFunctionTypes(Enum):
-    VALUE = "value"
-    MAP_VALUES = "value"  # "map_values"
-    WINDOW_VALUES = "value"  # "window_values"
-    AGGREGATE_VALUE = "value"  # "aggregate_value"
+        return pd.DataFrame({})
 
 
 class MetricDomainTypes(Enum):
@@ -58,68 +68,73 @@ class MetricDomainTypes(Enum):
 
 
 class DataConnectorStorageDataReferenceResolver:
-    DATA_CONNECTOR_NAME_TO_STORAGE_NAME_MAP: Dict[str, str] = {
-        "InferredAssetS3DataConnector": "S3",
-        "ConfiguredAssetS3DataConnector": "S3",
-        "InferredAssetGCSDataConnector": "GCS",
-        "ConfiguredAssetGCSDataConnector": "GCS",
-        "InferredAssetAzureDataConnector": "ABS",
-        "ConfiguredAssetAzureDataConnector": "ABS",
-        "InferredAssetDBFSDataConnector": "DBFS",
-        "ConfiguredAssetDBFSDataConnector": "DBFS",
-    }
-    STORAGE_NAME_EXECUTION_ENGINE_NAME_PATH_RESOLVERS: Dict[
+    # NOTE: The resolver tables are read-only, because the flattened lookup table below is computed from them at import.
+    DATA_CONNECTOR_NAME_TO_STORAGE_NAME_MAP: Mapping[str, str] = MappingProxyType(
+        {
+            "InferredAssetS3DataConnector": "S3",
+            "ConfiguredAssetS3DataConnector": "S3",
+            "InferredAssetGCSDataConnector": "GCS",
+            "ConfiguredAssetGCSDataConnector": "GCS",
+            "InferredAssetAzureDataConnector": "ABS",
+            "ConfiguredAssetAzureDataConnector": "ABS",
+            "InferredAssetDBFSDataConnector": "DBFS",
+            "ConfiguredAssetDBFSDataConnector": "DBFS",
+        }
+    )
+    STORAGE_NAME_EXECUTION_ENGINE_NAME_PATH_RESOLVERS: Mapping[
         Tuple[str, str], Callable
-    ] = {
-        (
-            "S3",
-            "PandasExecutionEngine",
-        ): lambda template_arguments: S3Url.OBJECT_URL_TEMPLATE.format(
-            **template_arguments
-        ),
-        (
-            "S3",
-            "SparkDFExecutionEngine",
-        ): lambda template_arguments: S3Url.OBJECT_URL_TEMPLATE.format(
-            **template_arguments
-        ),
-        (
-            "GCS",
-            "PandasExecutionEngine",
-        ): lambda template_arguments: GCSUrl.OBJECT_URL_TEMPLATE.format(
-            **template_arguments
-        ),
-        (
-            "GCS",
-            "SparkDFExecutionEngine",
-        ): lambda template_arguments: GCSUrl.OBJECT_URL_TEMPLATE.format(
-            **template_arguments
-        ),
-        (
-            "ABS",
-            "PandasExecutionEngine",
-        ): lambda template_arguments: AzureUrl.AZURE_BLOB_STORAGE_HTTPS_URL_TEMPLATE.format(
-            **template_arguments
-        ),
-        (
-            "ABS",
-            "SparkDFExecutionEngine",
-        ): lambda template_arguments: AzureUrl.AZURE_BLOB_STORAGE_WASBS_URL_TEMPLATE.format(
-            **template_arguments
-        ),
-        (
-            "DBFS",
-            "SparkDFExecutionEngine",
-        ): lambda template_arguments: DBFSPath.convert_to_protocol_version(
-            **template_arguments
-        ),
-        (
-            "DBFS",
-            "PandasExecutionEngine",
-        ): lambda template_arguments: DBFSPath.convert_to_file_semantics_version(
-            **template_arguments
-        ),
-    }
+    ] = MappingProxyType(
+        {
+            (
+                "S3",
+                "PandasExecutionEngine",
+            ): lambda template_arguments: S3Url.OBJECT_URL_TEMPLATE.format(
+                **template_arguments
+            ),
+            (
+                "S3",
+                "SparkDFExecutionEngine",
+            ): lambda template_arguments: S3Url.OBJECT_URL_TEMPLATE.format(
+                **template_arguments
+            ),
+            (
+                "GCS",
+                "PandasExecutionEngine",
+            ): lambda template_arguments: GCSUrl.OBJECT_URL_TEMPLATE.format(
+                **template_arguments
+            ),
+            (
+                "GCS",
+                "SparkDFExecutionEngine",
+            ): lambda template_arguments: GCSUrl.OBJECT_URL_TEMPLATE.format(
+                **template_arguments
+            ),
+            (
+                "ABS",
+                "PandasExecutionEngine",
+            ): lambda template_arguments: AzureUrl.AZURE_BLOB_STORAGE_HTTPS_URL_TEMPLATE.format(
+                **template_arguments
+            ),
+            (
+                "ABS",
+                "SparkDFExecutionEngine",
+            ): lambda template_arguments: AzureUrl.AZURE_BLOB_STORAGE_WASBS_URL_TEMPLATE.format(
+                **template_arguments
+            ),
+            (
+                "DBFS",
+                "SparkDFExecutionEngine",
+            ): lambda template_arguments: DBFSPath.convert_to_protocol_version(
+                **template_arguments
+            ),
+            (
+                "DBFS",
+                "PandasExecutionEngine",
+            ): lambda template_arguments: DBFSPath.convert_to_file_semantics_version(
+                **template_arguments
+            ),
+        }
+    )
 
     @staticmethod
     def resolve_data_reference(
@@ -128,14 +143,32 @@ class DataConnectorStorageDataReferenceResolver:
         template_arguments: dict,
     ):
         """Resolve file path for a (data_connector_name, execution_engine_name) combination."""
-        storage_name: str = DataConnectorStorageDataReferenceResolver.DATA_CONNECTOR_NAME_TO_STORAGE_NAME_MAP[
-            data_connector_name
-        ]
-        return DataConnectorStorageDataReferenceResolver.STORAGE_NAME_EXECUTION_ENGINE_NAME_PATH_RESOLVERS[
-            (storage_name, execution_engine_name)
-        ](
-            template_arguments
-        )
+        try:
+            path_resolver: Callable = (
+                _DATA_CONNECTOR_NAME_EXECUTION_ENGINE_NAME_PATH_RESOLVERS[
+                    (data_connector_name, execution_engine_name)
+                ]
+            )
+        except KeyError:
+            raise ge_exceptions.ExecutionEngineError(
+                f'Unable to resolve data reference for data connector "{data_connector_name}" using execution engine "{execution_engine_name}".'
+            )
+        return path_resolver(template_arguments)
+
+
+# Flattened (data_connector_name, execution_engine_name) -> path resolver table, so that resolving a data reference
+# requires a single lookup instead of going through the storage name.
+_DATA_CONNECTOR_NAME_EXECUTION_ENGINE_NAME_PATH_RESOLVERS: Dict[
+    Tuple[str, str], Callable
+] = {
+    (data_connector_name, execution_engine_name): path_resolver
+    for data_connector_name, storage_name in DataConnectorStorageDataReferenceResolver.DATA_CONNECTOR_NAME_TO_STORAGE_NAME_MAP.items()
+    for (
+        resolver_storage_name,
+        execution_engine_name,
+    ), path_resolver in DataConnectorStorageDataReferenceResolver.STORAGE_NAME_EXECUTION_ENGINE_NAME_PATH_RESOLVERS.items()
+    if resolver_storage_name == storage_name
+}
 
 
 class ExecutionEngine(ABC):
@@ -156,18 +189,19 @@ class ExecutionEngine(ABC):
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
         # NOTE: 20200918 - this is a naive cache; update.
-        if self._caching:
-            self._metric_cache = {}
-        else:
-            self._metric_cache = NoOpDict()
+        # NOTE: reads from and writes to the cache are guarded by "self._caching"; it simply stays empty otherwise.
+        self._metric_cache = {}
+
+        # Metric providers do not change over the lifetime of the execution engine; memoize registry lookups by name.
+        self._metric_provider_cache: Dict[str, Tuple[Any, Callable]] = {}
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
         batch_spec_defaults_keys = set(batch_spec_defaults.keys())
         if not batch_spec_defaults_keys <= self.recognized_batch_spec_defaults:
             logger.warning(
-                "Unrecognized batch_spec_default(s): %s"
-                % str(batch_spec_defaults_keys - self.recognized_batch_spec_defaults)
+                "Unrecognized batch_spec_default(s): %s",
+                batch_spec_defaults_keys - self.recognized_batch_spec_defaults,
             )
 
         self._batch_spec_defaults = {
@@ -183,8 +217,9 @@ class ExecutionEngine(ABC):
         self._load_batch_data_from_dict(batch_data_dict)
 
         # Gather the call arguments of the present function (and add the "class_name"), filter out the Falsy values, and
-        # set the instance "_config" variable equal to the resulting dictionary.
-        self._config = {
+        # set the instance "_config" variable equal to the resulting dictionary.  (Like "filter_properties_dict" with
+        # "clean_falsy=True", Falsy numerics, such as "caching=False", are retained.)
+        config: dict = {
             "name": name,
             "caching": caching,
             "batch_spec_defaults": batch_spec_defaults,
@@ -193,7 +228,11 @@ class ExecutionEngine(ABC):
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
-        filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+        self._config = {
+            key: value
+            for key, value in config.items()
+            if is_truthy(value=value) or is_numeric(value=value)
+        }
 
     def configure_validator(self, validator):
         """Optionally configure the validator as appropriate for the execution engine."""
@@ -302,24 +341,40 @@ class ExecutionEngine(ABC):
         if metrics is None:
             metrics = {}
 
-        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
-
         metric_fn_bundle = []
+        # Value-returning metrics are resolved together (in order), so that engines can share per-domain work.
+        metric_fn_group: List[Tuple[MetricConfiguration, Callable, dict]] = []
+        # Instance attributes used on every iteration are looked up once, ahead of the loop.
+        caching: bool = self._caching
+        metric_cache: Dict[Tuple[str, str, str], Any] = self._metric_cache
+        metric_provider_cache: Dict[
+            str, Tuple[Any, Callable]
+        ] = self._metric_provider_cache
+        metric_name: str
         for metric_to_resolve in metrics_to_resolve:
+            metric_name = metric_to_resolve.metric_name
             metric_dependencies = {}
             for k, v in metric_to_resolve.metric_dependencies.items():
-                if v.id in metrics:
-                    metric_dependencies[k] = metrics[v.id]
-                elif self._caching and v.id in self._metric_cache:
-                    metric_dependencies[k] = self._metric_cache[v.id]
+                metric_id: Tuple[str, str, str] = v.id
+                if metric_id in metrics:
+                    metric_dependencies[k] = metrics[metric_id]
+                elif caching and metric_id in metric_cache:
+                    metric_dependencies[k] = metric_cache[metric_id]
                 else:
                     raise ge_exceptions.MetricError(
-                        message=f'Missing metric dependency: {str(k)} for metric "{metric_to_resolve.metric_name}".'
+                        message=f'Missing metric dependency: {str(k)} for metric "{metric_name}".'
                     )
 
-            metric_class, metric_fn = get_metric_provider(
-                metric_name=metric_to_resolve.metric_name, execution_engine=self
+            metric_provider: Optional[Tuple[Any, Callable]] = metric_provider_cache.get(
+                metric_name
             )
+            if metric_provider is None:
+                metric_provider = get_metric_provider(
+                    metric_name=metric_name, execution_engine=self
+                )
+                metric_provider_cache[metric_name] = metric_provider
+
+            metric_class, metric_fn = metric_provider
             metric_provider_kwargs = {
                 "cls": metric_class,
                 "execution_engine": self,
@@ -337,7 +392,7 @@ class ExecutionEngine(ABC):
                     ) = metric_dependencies.pop("metric_partial_fn")
                 except KeyError as e:
                     raise ge_exceptions.MetricError(
-                        message=f'Missing metric dependency: {str(e)} for metric "{metric_to_resolve.metric_name}".'
+                        message=f'Missing metric dependency: {str(e)} for metric "{metric_name}".'
                     )
                 metric_fn_bundle.append(
                     (
@@ -349,51 +404,30 @@ class ExecutionEngine(ABC):
                     )
                 )
                 continue
-            metric_fn_type = getattr(
-                metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE
-            )
-            if metric_fn_type in [
-                MetricPartialFunctionTypes.MAP_FN,
-                MetricPartialFunctionTypes.MAP_CONDITION_FN,
-                MetricPartialFunctionTypes.WINDOW_FN,
-                MetricPartialFunctionTypes.WINDOW_CONDITION_FN,
-                MetricPartialFunctionTypes.AGGREGATE_FN,
-            ]:
-                # NOTE: 20201026 - JPC - we could use the fact that these metric functions return functions rather
-                # than data to optimize compute in the future
-                try:
-                    resolved_metrics[metric_to_resolve.id] = metric_fn(
-                        **metric_provider_kwargs
-                    )
-                except Exception as e:
-                    raise ge_exceptions.MetricResolutionError(
-                        message=str(e), failed_metrics=(metric_to_resolve,)
-                    )
-            elif metric_fn_type in [
-                MetricFunctionTypes.VALUE,
-                MetricPartialFunctionTypes.MAP_SERIES,
-                MetricPartialFunctionTypes.MAP_CONDITION_SERIES,
-            ]:
-                try:
-                    resolved_metrics[metric_to_resolve.id] = metric_fn(
-                        **metric_provider_kwargs
-                    )
-                except Exception as e:
-                    raise ge_exceptions.MetricResolutionError(
-                        message=str(e), failed_metrics=(metric_to_resolve,)
-                    )
-            else:
+            # Registered metric functions are tagged with their kind once, upon registration.
+            metric_fn_kind: Optional[int] = getattr(metric_fn, "metric_fn_kind", None)
+            if metric_fn_kind is None:
+                metric_fn_kind = _get_metric_fn_kind(metric_fn=metric_fn)
+            if metric_fn_kind == _METRIC_FN_KIND_UNRECOGNIZED:
                 logger.warning(
-                    f"Unrecognized metric function type while trying to resolve {str(metric_to_resolve.id)}"
+                    "Unrecognized metric function type while trying to resolve %s",
+                    metric_to_resolve.id,
                 )
-                try:
-                    resolved_metrics[metric_to_resolve.id] = metric_fn(
-                        **metric_provider_kwargs
-                    )
-                except Exception as e:
-                    raise ge_exceptions.MetricResolutionError(
-                        message=str(e), failed_metrics=(metric_to_resolve,)
-                    )
+            # NOTE: 20201026 - JPC - we could use the fact that partial metric functions return functions rather than
+            # data to optimize compute in the future
+            metric_fn_group.append(
+                (
+                    metric_to_resolve,
+                    metric_fn,
+                    metric_provider_kwargs,
+                )
+            )
+        # The (freshly built) dictionary returned by resolve_metric_group is used as is, rather than copied.
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = (
+            self.resolve_metric_group(metric_fn_group=metric_fn_group)
+            if len(metric_fn_group) > 0
+            else {}
+        )
         if len(metric_fn_bundle) > 0:
             try:
                 new_resolved = self.resolve_metric_bundle(metric_fn_bundle)
@@ -402,8 +436,37 @@ class ExecutionEngine(ABC):
                 raise ge_exceptions.MetricResolutionError(
                     message=str(e), failed_metrics=[x[0] for x in metric_fn_bundle]
                 )
-        if self._caching:
-            self._metric_cache.update(resolved_metrics)
+        if caching and resolved_metrics:
+            metric_cache.update(resolved_metrics)
+
+        return resolved_metrics
+
+    def resolve_metric_group(
+        self,
+        metric_fn_group: List[Tuple[MetricConfiguration, Callable, dict]],
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Resolve a group of value-returning metrics, one at a time and in the order given.
+
+        Execution engines may override this method in order to share work (e.g., obtaining the domain records) among
+        members of the group that have the same metric domain.
+
+        Args:
+            metric_fn_group: (metric_to_resolve, metric_fn, metric_provider_kwargs) tuples
+
+        Returns:
+            resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
+        """
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+
+        for metric_to_resolve, metric_fn, metric_provider_kwargs in metric_fn_group:
+            try:
+                resolved_metrics[metric_to_resolve.id] = metric_fn(
+                    **metric_provider_kwargs
+                )
+            except Exception as e:
+                raise ge_exceptions.MetricResolutionError(
+                    message=str(e), failed_metrics=(metric_to_resolve,)
+                )
 
         return resolved_metrics
 
@@ -476,7 +539,8 @@ class ExecutionEngine(ABC):
                 "ExecutionEngine does not support updating existing row_conditions."
             )
 
-        new_domain_kwargs = copy.deepcopy(domain_kwargs)
+        # NOTE: only top-level keys are added below, so a shallow copy of domain_kwargs suffices.
+        new_domain_kwargs = dict(domain_kwargs)
         assert "column" in domain_kwargs or column_name is not None
         if column_name is not None:
             column = column_name
@@ -523,50 +587,26 @@ class ExecutionEngine(ABC):
             domain_type == MetricDomainTypes.TABLE
         ), "This method only supports MetricDomainTypes.TABLE"
 
-        compute_domain_kwargs: Dict = copy.deepcopy(domain_kwargs)
+        # NOTE: only top-level keys are moved below, so a shallow copy of domain_kwargs suffices.
+        compute_domain_kwargs: Dict = dict(domain_kwargs)
         accessor_domain_kwargs: Dict = {}
 
-        if accessor_keys is not None and len(list(accessor_keys)) > 0:
+        if accessor_keys is not None:
+            key: str
             for key in accessor_keys:
                 accessor_domain_kwargs[key] = compute_domain_kwargs.pop(key)
         if len(domain_kwargs.keys()) > 0:
             # Warn user if kwarg not "normal".
-            unexpected_keys: set = set(compute_domain_kwargs.keys()).difference(
-                {
-                    "batch_id",
-                    "table",
-                    "row_condition",
-                    "condition_parser",
-                }
+            unexpected_keys: set = (
+                compute_domain_kwargs.keys() - _TABLE_DOMAIN_KWARGS_EXPECTED_KEYS
             )
-            if len(unexpected_keys) > 0:
+            if len(unexpected_keys) > 0 and logger.isEnabledFor(logging.WARNING):
                 unexpected_keys_str: str = ", ".join(
                     map(lambda element: f'"{element}"', unexpected_keys)
                 )
                 logger.warning(
-                    f'Unexpected key(s) {unexpected_keys_str} found in domain_kwargs for domain type "{domain_type.value}".'
+                    'Unexpected key(s) %s found in domain_kwargs for domain type "%s".',
+                    unexpected_keys_str,
+                    domain_type.value,
                 )
         return compute_domain_kwargs, accessor_domain_kwargs
-
-
-class MetricPartialFunctionTypes(Enum):
-    MAP_FN = "map_fn"
-    MAP_SERIES = "map_series"
-    MAP_CONDITION_FN = "map_condition_fn"
-    MAP_CONDITION_SERIES = "map_condition_series"
-    WINDOW_FN = "window_fn"
-    WINDOW_CONDITION_FN = "window_condition_fn"
-    AGGREGATE_FN = "aggregate_fn"
-
-    @property
-    def metric_suffix(self):
-        if self.name in ["MAP_FN", "MAP_SERIES", "WINDOW_FN"]:
-            return "map"
-        elif self.name in [
-            "MAP_CONDITION_FN",
-            "MAP_CONDITION_SERIES",
-            "WINDOW_CONDITION_FN",
-        ]:
-            return "condition"
-        elif self.name in ["AGGREGATE_FN"]:
-            return "aggregate_fn"
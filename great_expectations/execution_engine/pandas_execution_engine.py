@@ -7,7 +7,7 @@ import random
 import warnings
 from functools import partial
 from io import BytesIO
-from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -25,6 +25,7 @@ from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compr
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -117,6 +118,13 @@ Notes:
         self._azure = None
         self._gcs = None
 
+        # Row condition query results shared among the metrics of a group, while "resolve_metric_group" is running (None
+        # otherwise).  Keyed by (batch_id, row_condition, condition_parser), since the query result is the same for all
+        # (e.g., column) domains filtered by a given row condition.
+        self._domain_records_cache: Optional[
+            Dict[Tuple[str, str, str], pd.DataFrame]
+        ] = None
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -422,6 +430,23 @@ Please check your config."""
                 f'Unable to find reader_method "{reader_method}" in pandas.'
             )
 
+    def resolve_metric_group(
+        self,
+        metric_fn_group: List[Tuple[MetricConfiguration, Callable, dict]],
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Resolve a group of metrics, querying the batch only once per row condition."""
+        # A single call site keeps tracebacks of failed metrics identical (they are deduplicated upon reporting).
+        owns_cache: bool = (
+            len(metric_fn_group) > 1 and self._domain_records_cache is None
+        )
+        if owns_cache:
+            self._domain_records_cache = {}
+        try:
+            return super().resolve_metric_group(metric_fn_group=metric_fn_group)
+        finally:
+            if owns_cache:
+                self._domain_records_cache = None
+
     def get_domain_records(
         self,
         domain_kwargs: dict,
@@ -472,7 +497,14 @@ Please check your config."""
                 )
             else:
                 # Querying row condition
-                data = data.query(row_condition, parser=condition_parser)
+                data = self._query_row_condition(
+                    data=data,
+                    batch_id=batch_id
+                    if batch_id is not None
+                    else self.active_batch_data_id,
+                    row_condition=row_condition,
+                    condition_parser=condition_parser,
+                )
 
         if "column" in domain_kwargs:
             return data
@@ -542,6 +574,25 @@ Please check your config."""
 
         return data
 
+    def _query_row_condition(
+        self,
+        data: pd.DataFrame,
+        batch_id: str,
+        row_condition: str,
+        condition_parser: str,
+    ) -> pd.DataFrame:
+        if self._domain_records_cache is None:
+            return data.query(row_condition, parser=condition_parser)
+
+        query_key: Tuple[str, str, str] = (batch_id, row_condition, condition_parser)
+        queried_data: Optional[pd.DataFrame] = self._domain_records_cache.get(query_key)
+        if queried_data is None:
+            queried_data = data.query(row_condition, parser=condition_parser)
+            self._domain_records_cache[query_key] = queried_data
+
+        # Each metric receives its own copy, so that in-place modifications by one metric are not seen by the others.
+        return queried_data.copy()
+
     def get_compute_domain(
         self,
         domain_kwargs: dict,
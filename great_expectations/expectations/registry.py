@@ -1,12 +1,43 @@
 import logging
+from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric import Metric
+from great_expectations.core.metric_function_types import (
+    MetricFunctionTypes,
+    MetricPartialFunctionTypes,
+)
 
 logger = logging.getLogger(__name__)
 
+# Precomputed dispatch table, so that each metric function is classified (upon registration) with a single dict lookup.
+_METRIC_FN_KIND_PARTIAL: int = 0
+_METRIC_FN_KIND_VALUE: int = 1
+_METRIC_FN_KIND_UNRECOGNIZED: int = 2
+
+_METRIC_FN_TYPE_TO_METRIC_FN_KIND: Dict[Enum, int] = {
+    MetricPartialFunctionTypes.MAP_FN: _METRIC_FN_KIND_PARTIAL,
+    MetricPartialFunctionTypes.MAP_CONDITION_FN: _METRIC_FN_KIND_PARTIAL,
+    MetricPartialFunctionTypes.WINDOW_FN: _METRIC_FN_KIND_PARTIAL,
+    MetricPartialFunctionTypes.WINDOW_CONDITION_FN: _METRIC_FN_KIND_PARTIAL,
+    MetricPartialFunctionTypes.AGGREGATE_FN: _METRIC_FN_KIND_PARTIAL,
+    MetricFunctionTypes.VALUE: _METRIC_FN_KIND_VALUE,
+    MetricPartialFunctionTypes.MAP_SERIES: _METRIC_FN_KIND_VALUE,
+    MetricPartialFunctionTypes.MAP_CONDITION_SERIES: _METRIC_FN_KIND_VALUE,
+}
+
+
+def _get_metric_fn_kind(metric_fn: Callable) -> int:
+    metric_fn_type: Enum = getattr(
+        metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE
+    )
+    return _METRIC_FN_TYPE_TO_METRIC_FN_KIND.get(
+        metric_fn_type, _METRIC_FN_KIND_UNRECOGNIZED
+    )
+
+
 _registered_expectations = {}
 _registered_metrics = {}
 _registered_renderers = {}
@@ -114,8 +145,12 @@ def register_metric(
     res = {}
     execution_engine_name = execution_engine.__name__
     logger.debug(f"Registering metric: {metric_name}")
-    if metric_provider is not None and metric_fn_type is not None:
-        metric_provider.metric_fn_type = metric_fn_type
+    if metric_provider is not None:
+        if metric_fn_type is not None:
+            metric_provider.metric_fn_type = metric_fn_type
+
+        # Tag the metric function with its (integer) kind, so that metric resolution can dispatch on it directly.
+        metric_provider.metric_fn_kind = _get_metric_fn_kind(metric_fn=metric_provider)
     if metric_name in _registered_metrics:
         metric_definition = _registered_metrics[metric_name]
         current_domain_keys = metric_definition.get("metric_domain_keys", set())
@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import List, Optional, Set, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import Batch, BatchRequest, RuntimeBatchRequest
@@ -59,22 +59,24 @@ class ColumnDomainBuilder(DomainBuilder):
         variables: Optional[ParameterContainer] = None,
     ) -> List[str]:
         # Obtain include_columns from "rule state" (i.e., variables and parameters); from instance variable otherwise.
-        include_columns = get_parameter_value_and_validate_return_type(
-            domain=None,
-            parameter_reference=include_columns,
-            expected_return_type=None,
-            variables=variables,
-            parameters=None,
-        )
+        if include_columns is not None:
+            include_columns = get_parameter_value_and_validate_return_type(
+                domain=None,
+                parameter_reference=include_columns,
+                expected_return_type=None,
+                variables=variables,
+                parameters=None,
+            )
 
         # Obtain exclude_columns from "rule state" (i.e., variables and parameters); from instance variable otherwise.
-        exclude_columns = get_parameter_value_and_validate_return_type(
-            domain=None,
-            parameter_reference=exclude_columns,
-            expected_return_type=None,
-            variables=variables,
-            parameters=None,
-        )
+        if exclude_columns is not None:
+            exclude_columns = get_parameter_value_and_validate_return_type(
+                domain=None,
+                parameter_reference=exclude_columns,
+                expected_return_type=None,
+                variables=variables,
+                parameters=None,
+            )
 
         batch_ids: List[str] = self.get_batch_ids(variables=variables)
 
@@ -89,24 +91,38 @@ class ColumnDomainBuilder(DomainBuilder):
             )
         )
 
+        # Common case: neither inclusion nor exclusion directives are specified, so all table columns are effective.
+        if not (include_columns or exclude_columns):
+            return list(table_columns)
+
         effective_column_names: List[str] = include_columns or table_columns
 
         if exclude_columns is None:
             exclude_columns = []
 
+        # Use sets for membership tests in order to avoid quadratic behavior on wide tables.  A string directive keeps
+        # its original (substring) membership semantics.
+        exclude_column_names: Union[str, Set[str]] = (
+            exclude_columns
+            if isinstance(exclude_columns, str)
+            else set(exclude_columns)
+        )
+
         column_name: str
         effective_column_names = [
             column_name
             for column_name in effective_column_names
-            if column_name not in exclude_columns
+            if column_name not in exclude_column_names
         ]
 
-        if set(effective_column_names) == set(table_columns):
+        table_column_names: Set[str] = set(table_columns)
+
+        if set(effective_column_names) == table_column_names:
             return effective_column_names
 
         column_name: str
         for column_name in effective_column_names:
-            if column_name not in table_columns:
+            if column_name not in table_column_names:
                 raise ge_exceptions.ProfilerExecutionError(
                     message=f'Error: The column "{column_name}" in BatchData does not exist.'
                 )
@@ -1,5 +1,8 @@
+import itertools
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
+
 from great_expectations.core.batch import Batch, BatchRequest, RuntimeBatchRequest
 from great_expectations.rule_based_profiler.domain_builder import ColumnDomainBuilder
 from great_expectations.rule_based_profiler.helpers.util import (
@@ -161,33 +164,40 @@ class MapMetricColumnDomainBuilder(ColumnDomainBuilder):
         batch_ids: List[str] = self.get_batch_ids(variables=variables)
         num_batch_ids: int = len(batch_ids)
 
+        # Inter-Batch adherence fraction cannot exceed 1.0; hence, if "min_max_unexpected_values_proportion" is greater,
+        # then no column can satisfy tolerance limits, and resolving "unexpected_count" metrics can be skipped entirely.
+        if min_max_unexpected_values_proportion > 1.0:
+            return []
+
         table_row_counts: Dict[str, int] = self.get_table_row_counts(
             validator=validator,
             batch_ids=batch_ids,
             variables=variables,
         )
         mean_table_row_count_as_float: float = (
-            1.0 * sum(table_row_counts.values()) / num_batch_ids
+            sum(table_row_counts.values()) / num_batch_ids
         )
 
         # If no "max_unexpected_ratio" is given, compute it based on average number of records across all Batch objects.
         if max_unexpected_ratio is None:
             max_unexpected_ratio = max_unexpected_values / mean_table_row_count_as_float
 
-        metric_configurations_by_column_name: Dict[
-            str, List[MetricConfiguration]
-        ] = self._generate_metric_configurations(
-            map_metric_name=map_metric_name,
-            batch_ids=batch_ids,
-            column_names=table_column_names,
+        resolved_metrics_by_column_name: Dict[
+            str, Dict[Tuple[str, str, str], Any]
+        ] = get_resolved_metrics_by_key(
+            validator=validator,
+            metric_configurations_by_key=self._generate_metric_configurations(
+                map_metric_name=map_metric_name,
+                batch_ids=batch_ids,
+                column_names=table_column_names,
+            ),
         )
 
         candidate_column_names: List[
             str
         ] = self._get_column_names_satisfying_tolerance_limits(
-            validator=validator,
             num_batch_ids=num_batch_ids,
-            metric_configurations_by_column_name=metric_configurations_by_column_name,
+            resolved_metrics_by_column_name=resolved_metrics_by_column_name,
             mean_table_row_count_as_float=mean_table_row_count_as_float,
             max_unexpected_ratio=max_unexpected_ratio,
             min_max_unexpected_values_proportion=min_max_unexpected_values_proportion,
@@ -218,12 +228,14 @@ class MapMetricColumnDomainBuilder(ColumnDomainBuilder):
                 column_name: List[MetricConfiguration],
             }
         """
+        metric_name: str = f"{map_metric_name}.unexpected_count"
+
         column_name: str
         batch_id: str
         metric_configurations: Dict[str, List[MetricConfiguration]] = {
             column_name: [
                 MetricConfiguration(
-                    metric_name=f"{map_metric_name}.unexpected_count",
+                    metric_name=metric_name,
                     metric_domain_kwargs={
                         "column": column_name,
                         "batch_id": batch_id,
@@ -240,9 +252,8 @@ class MapMetricColumnDomainBuilder(ColumnDomainBuilder):
 
     @staticmethod
     def _get_column_names_satisfying_tolerance_limits(
-        validator: "Validator",  # noqa: F821
         num_batch_ids: int,
-        metric_configurations_by_column_name: Dict[str, List[MetricConfiguration]],
+        resolved_metrics_by_column_name: Dict[str, Dict[Tuple[str, str, str], Any]],
         mean_table_row_count_as_float: float,
         max_unexpected_ratio: float,
         min_max_unexpected_values_proportion: float,
@@ -251,8 +262,8 @@ class MapMetricColumnDomainBuilder(ColumnDomainBuilder):
         Compute figures of merit and return column names satisfying tolerance limits.
 
         Args:
-            validator: Validator used to compute column cardinality.
-            metric_configurations_by_column_name: metric configurations used to compute figures of merit.
+            num_batch_ids: number of Batch objects, for which "unexpected_count" values were resolved.
+            resolved_metrics_by_column_name: "unexpected_count" values (one per batch_id) used to compute figures of merit.
             mean_table_row_count_as_float: average number of records over available Batch objects.
             max_unexpected_ratio: maximum "unexpected_count" value of "map_metric_name" averaged over numbers of records
             min_max_unexpected_values_proportion: minimum fraction of Batch objects adhering to "max_unexpected_ratio"
@@ -260,49 +271,38 @@ class MapMetricColumnDomainBuilder(ColumnDomainBuilder):
         Returns:
             List of column names satisfying tolerance limits.
         """
-        column_name: str
         resolved_metrics: Dict[Tuple[str, str, str], Any]
 
-        resolved_metrics_by_column_name: Dict[
-            str, Dict[Tuple[str, str, str], Any]
-        ] = get_resolved_metrics_by_key(
-            validator=validator,
-            metric_configurations_by_key=metric_configurations_by_column_name,
+        column_names: List[str] = list(resolved_metrics_by_column_name.keys())
+        if not column_names:
+            return []
+
+        # Compute intra-Batch ratios, their adherence to "max_unexpected_ratio", and inter-Batch adherence fractions for
+        # all columns at once, using an array of "unexpected_count" values of shape (num_column_names, num_batch_ids).
+        # Values are read directly into contiguous buffer (no intermediate lists of boxed Python numbers are created).
+        unexpected_counts: np.ndarray = np.fromiter(
+            itertools.chain.from_iterable(
+                resolved_metrics.values()
+                for resolved_metrics in resolved_metrics_by_column_name.values()
+            ),
+            dtype=np.float64,
+            count=len(column_names) * num_batch_ids,
+        ).reshape(len(column_names), num_batch_ids)
+        # Ratios are computed in place and adhering Batch objects are counted directly (no intermediate float arrays).
+        unexpected_ratios: np.ndarray = np.divide(
+            unexpected_counts, mean_table_row_count_as_float, out=unexpected_counts
         )
-
-        metric_value: Any
-        intra_batch_unexpected_ratios_by_column_name: Dict[str, List[float]] = {
-            column_name: [
-                metric_value / mean_table_row_count_as_float
-                for metric_value in resolved_metrics.values()
-            ]
-            for column_name, resolved_metrics in resolved_metrics_by_column_name.items()
-        }
-
-        metric_value_ratio: float
-        intra_batch_adherence_by_column_name: Dict[str, List[bool]] = {
-            column_name: [
-                metric_value_ratio <= max_unexpected_ratio
-                for metric_value_ratio in intra_batch_unexpected_ratios_by_column_name[
-                    column_name
-                ]
-            ]
-            for column_name in intra_batch_unexpected_ratios_by_column_name.keys()
-        }
-
-        inter_batch_adherence_by_column_name: Dict[str, float] = {
-            column_name: 1.0
-            * sum(intra_batch_adherence_by_column_name[column_name])
+        inter_batch_adherence: np.ndarray = (
+            np.count_nonzero(unexpected_ratios <= max_unexpected_ratio, axis=1)
             / num_batch_ids
-            for column_name in intra_batch_adherence_by_column_name.keys()
-        }
-
-        inter_batch_unexpected_values_proportion: float
+        )
+        # Only indices of columns satisfying tolerance limits are scanned (no intermediate list of flags is created).
+        column_index: int
         candidate_column_names: List[str] = [
-            column_name
-            for column_name, inter_batch_unexpected_values_proportion in inter_batch_adherence_by_column_name.items()
-            if inter_batch_unexpected_values_proportion
-            >= min_max_unexpected_values_proportion
+            column_names[column_index]
+            for column_index in np.flatnonzero(
+                inter_batch_adherence >= min_max_unexpected_values_proportion
+            ).tolist()
         ]
 
         return candidate_column_names
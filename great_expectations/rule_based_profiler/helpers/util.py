@@ -1,5 +1,4 @@
 import copy
-import itertools
 import logging
 import uuid
 from numbers import Number
@@ -185,14 +184,20 @@ def get_parameter_value_and_validate_return_type(
     or as a fully-qualified parameter name.  In either case, it can optionally validate the type of the return value.
     """
     if isinstance(parameter_reference, dict):
-        parameter_reference = dict(copy.deepcopy(parameter_reference))
-
-    parameter_reference = get_parameter_value(
-        domain=domain,
-        parameter_reference=parameter_reference,
-        variables=variables,
-        parameters=parameters,
-    )
+        parameter_reference = get_parameter_value(
+            domain=domain,
+            parameter_reference=dict(copy.deepcopy(parameter_reference)),
+            variables=variables,
+            parameters=parameters,
+        )
+    elif _is_fully_qualified_parameter_name(parameter_reference=parameter_reference):
+        parameter_reference = get_parameter_value(
+            domain=domain,
+            parameter_reference=parameter_reference,
+            variables=variables,
+            parameters=parameters,
+        )
+    # Otherwise, "parameter_reference" is literal value (no resolution required) and is validated as is.
 
     if expected_return_type is not None:
         if not isinstance(parameter_reference, expected_return_type):
@@ -224,7 +229,7 @@ def get_parameter_value(
                 variables=variables,
                 parameters=parameters,
             )
-    elif isinstance(parameter_reference, str) and parameter_reference.startswith("$"):
+    elif _is_fully_qualified_parameter_name(parameter_reference=parameter_reference):
         parameter_reference = get_parameter_value_by_fully_qualified_parameter_name(
             fully_qualified_parameter_name=parameter_reference,
             domain=domain,
@@ -243,6 +248,12 @@ def get_parameter_value(
     return parameter_reference
 
 
+def _is_fully_qualified_parameter_name(parameter_reference: Optional[Any]) -> bool:
+    # Fully-qualified parameter names (e.g., "$variables.max_unexpected_ratio") require resolution; any other
+    # "parameter_reference" is a literal value (no resolution required).
+    return isinstance(parameter_reference, str) and parameter_reference.startswith("$")
+
+
 def get_resolved_metrics_by_key(
     validator: "Validator",  # noqa: F821
     metric_configurations_by_key: Dict[str, List[MetricConfiguration]],
@@ -285,50 +296,20 @@ def get_resolved_metrics_by_key(
         for key, metric_configurations_for_key in metric_configurations_by_key.items()
     }
 
+    # Step 3: Retain only those keys, for which every "MetricConfiguration" object has been resolved successfully, and
+    # regroup corresponding metric computation results by key (dictionary lookups keep this linear in number of metrics).
     metric_configuration_ids: List[Tuple[str, str, str]]
-    # Step 3: Obtain flattened list of "MetricConfiguration" ID values across all key values/combinations.
-    metric_configuration_ids_all_keys: List[Tuple[str, str, str]] = list(
-        itertools.chain(
-            *[
-                metric_configuration_ids
-                for metric_configuration_ids in metric_configuration_ids_by_key.values()
-            ]
-        )
-    )
-
-    # Step 4: Retain only those metric computation results that both, correspond to "MetricConfiguration" objects of
-    # interest (reflecting specified key values/combinations).
     metric_configuration_id: Tuple[str, str, str]
-    metric_value: Any
-    resolved_metrics = {
-        metric_configuration_id: metric_value
-        for metric_configuration_id, metric_value in resolved_metrics.items()
-        if metric_configuration_id in metric_configuration_ids_all_keys
-    }
-
-    # Step 5: Gather "MetricConfiguration" ID values for effective collection of resolved metrics.
-    metric_configuration_ids_resolved_metrics: List[Tuple[str, str, str]] = list(
-        resolved_metrics.keys()
-    )
-
-    # Step 6: Produce "key" list, corresponding to effective "MetricConfiguration" ID values.
-    candidate_keys: List[str] = [
-        key
-        for key, metric_configuration_ids in metric_configuration_ids_by_key.items()
-        if all(
-            [
-                metric_configuration_id in metric_configuration_ids_resolved_metrics
-                for metric_configuration_id in metric_configuration_ids
-            ]
-        )
-    ]
-
     resolved_metrics_by_key: Dict[str, Dict[Tuple[str, str, str], Any]] = {
         key: {
-            metric_configuration.id: resolved_metrics[metric_configuration.id]
-            for metric_configuration in metric_configurations_by_key[key]
+            metric_configuration_id: resolved_metrics[metric_configuration_id]
+            for metric_configuration_id in metric_configuration_ids
         }
-        for key in candidate_keys
+        for key, metric_configuration_ids in metric_configuration_ids_by_key.items()
+        if all(
+            metric_configuration_id in resolved_metrics
+            for metric_configuration_id in metric_configuration_ids
+        )
     }
 
     return resolved_metrics_by_key
@@ -1157,10 +1157,45 @@ def deep_filter_properties_iterable(
     keep_falsy_numerics: bool = True,
     inplace: bool = False,
 ) -> Optional[Union[dict, list, set]]:
-    if isinstance(properties, dict):
-        if not inplace:
-            properties = copy.deepcopy(properties)
+    if isinstance(properties, (dict, list, set, tuple)) and not inplace:
+        properties = copy.deepcopy(properties)
+
+    properties = _deep_filter_properties_iterable(
+        properties=properties,
+        keep_fields=keep_fields,
+        delete_fields=delete_fields,
+        clean_nulls=clean_nulls,
+        clean_falsy=clean_falsy,
+        keep_falsy_numerics=keep_falsy_numerics,
+        visited_ids=set(),
+    )
+
+    if inplace:
+        return None
+
+    return properties
+
 
+def _deep_filter_properties_iterable(
+    properties: Optional[Union[dict, list, set, tuple]],
+    keep_fields: Optional[Set[str]],
+    delete_fields: Optional[Set[str]],
+    clean_nulls: bool,
+    clean_falsy: bool,
+    keep_falsy_numerics: bool,
+    visited_ids: Set[int],
+) -> Optional[Union[dict, list, set]]:
+    """
+    Filters "properties" in place; sub-structures referenced more than once (shared by identity) are filtered only once,
+    since filtering is idempotent ("visited_ids" holds identities of iterables already filtered during current call).
+    """
+    if isinstance(properties, (dict, list, set, tuple)):
+        if id(properties) in visited_ids:
+            return properties
+
+        visited_ids.add(id(properties))
+
+    if isinstance(properties, dict):
         filter_properties_dict(
             properties=properties,
             keep_fields=keep_fields,
@@ -1174,14 +1209,14 @@ def deep_filter_properties_iterable(
         key: str
         value: Any
         for key, value in properties.items():
-            deep_filter_properties_iterable(
+            _deep_filter_properties_iterable(
                 properties=value,
                 keep_fields=keep_fields,
                 delete_fields=delete_fields,
                 clean_nulls=clean_nulls,
                 clean_falsy=clean_falsy,
                 keep_falsy_numerics=keep_falsy_numerics,
-                inplace=True,
+                visited_ids=visited_ids,
             )
 
         # Upon unwinding the call stack, do a sanity check to ensure cleaned properties
@@ -1200,19 +1235,16 @@ def deep_filter_properties_iterable(
             properties.pop(key)
 
     elif isinstance(properties, (list, set, tuple)):
-        if not inplace:
-            properties = copy.deepcopy(properties)
-
         value: Any
         for value in properties:
-            deep_filter_properties_iterable(
+            _deep_filter_properties_iterable(
                 properties=value,
                 keep_fields=keep_fields,
                 delete_fields=delete_fields,
                 clean_nulls=clean_nulls,
                 clean_falsy=clean_falsy,
                 keep_falsy_numerics=keep_falsy_numerics,
-                inplace=True,
+                visited_ids=visited_ids,
             )
 
         # Upon unwinding the call stack, do a sanity check to ensure cleaned properties
@@ -1228,9 +1260,6 @@ def deep_filter_properties_iterable(
             )
         )
 
-    if inplace:
-        return None
-
     return properties
 
 
@@ -1,10 +1,19 @@
 import uuid
+from hashlib import md5
+from typing import Dict, Optional
 
 import pytest
 
 from great_expectations.core.batch import BatchRequest
 from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.core.usage_statistics.anonymizers.action_anonymizer import (
+    ActionAnonymizer,
+)
 from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
+from great_expectations.core.usage_statistics.anonymizers.validation_operator_anonymizer import (
+    ValidationOperatorAnonymizer,
+)
+from great_expectations.validation_operators import NoOpAction
 
 
 @pytest.fixture
@@ -82,6 +91,20 @@ def test_anonymizer_consistent_salt():
     assert len(anon_name_2) == 32
 
 
+def test_anonymizer_is_salted_md5_of_name():
+    # Anonymized names must remain stable across releases, so the hashing scheme itself is pinned down here.
+    anonymizer = Anonymizer(salt="00000000-0000-0000-0000-00000000a004")
+
+    test_name = "i_am_a_name"
+
+    assert (
+        anonymizer.anonymize(test_name)
+        == md5(f"00000000-0000-0000-0000-00000000a004{test_name}".encode()).hexdigest()
+    )
+    # Repeated calls do not alter the salted hash state.
+    assert anonymizer.anonymize(test_name) == anonymizer.anonymize(test_name)
+
+
 def test_anonymizer__is_parent_class_recognized():
     """
     What does this test and why?
@@ -235,3 +258,76 @@ def test_anonymize_object_info_with_missing_args_raises_error(
         )
 
     assert "Must pass either" in str(e.value)
+
+
+def test_validation_operator_anonymizer_action_anonymizer_uses_same_salt():
+    salt: str = "00000000-0000-0000-0000-00000000a004"
+
+    validation_operator_anonymizer: ValidationOperatorAnonymizer = (
+        ValidationOperatorAnonymizer(salt=salt)
+    )
+    assert validation_operator_anonymizer._action_anonymizer.salt == salt
+
+
+def test_anonymize_action_info_list(anonymizer_with_consistent_salt):
+    action_anonymizer: ActionAnonymizer = ActionAnonymizer(
+        salt=anonymizer_with_consistent_salt.salt
+    )
+
+    class MyCustomAction(NoOpAction):
+        pass
+
+    actions: dict = {
+        "no_op": NoOpAction(data_context=None),
+        "my_custom_action": MyCustomAction(data_context=None),
+    }
+
+    assert action_anonymizer.anonymize_action_info_list(actions=actions) == [
+        {
+            "anonymized_name": action_anonymizer.anonymize("no_op"),
+            "parent_class": "NoOpAction",
+        },
+        {
+            "anonymized_name": action_anonymizer.anonymize("my_custom_action"),
+            "parent_class": "NoOpAction",
+            "anonymized_class": action_anonymizer.anonymize("MyCustomAction"),
+        },
+    ]
+
+
+def test_is_parent_class_recognized_returns_first_matching_class():
+    classes_to_check: list = [TestClass, BaseTestClass]
+    parent_class_names_by_class: Dict[type, Optional[str]] = {}
+
+    # Repeated checks are served from the provided cache; they must yield the same answers.
+    for _ in range(2):
+        assert (
+            Anonymizer._is_parent_class_recognized(
+                classes_to_check=classes_to_check,
+                object_class=MyCustomTestClass,
+                parent_class_names_by_class=parent_class_names_by_class,
+            )
+            == "TestClass"
+        )
+        assert (
+            Anonymizer._is_parent_class_recognized(
+                classes_to_check=classes_to_check,
+                object_=BaseTestClass(),
+                parent_class_names_by_class=parent_class_names_by_class,
+            )
+            == "BaseTestClass"
+        )
+        assert (
+            Anonymizer._is_parent_class_recognized(
+                classes_to_check=classes_to_check,
+                object_class=SomeOtherClass,
+                parent_class_names_by_class=parent_class_names_by_class,
+            )
+            is None
+        )
+
+    assert parent_class_names_by_class == {
+        MyCustomTestClass: "TestClass",
+        BaseTestClass: "BaseTestClass",
+        SomeOtherClass: None,
+    }
@@ -3,6 +3,7 @@ import pytest
 
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 # Testing ordinary process of adding column row condition
@@ -20,12 +21,15 @@ def test_add_column_row_condition():
     }
 
     # Ensuring that this also works when formatted differently
-    new_domain_kwargs = e.add_column_row_condition({"column": "a"})
+    domain_kwargs = {"column": "a"}
+    new_domain_kwargs = e.add_column_row_condition(domain_kwargs)
     assert new_domain_kwargs == {
         "column": "a",
         "condition_parser": "great_expectations__experimental__",
         "row_condition": 'col("a").notnull()',
     }
+    # Ensuring that the original domain_kwargs are left untouched
+    assert domain_kwargs == {"column": "a"}
 
     # Ensuring that everything still works if a row condition of None given
     new_domain_kwargs = e.add_column_row_condition(
@@ -141,6 +145,37 @@ def test_resolve_metrics_with_aggregates_and_column_map():
     assert results[desired_metric.id] == 0
 
 
+def test_resolve_metrics_memoizes_metric_providers():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+
+    assert set(engine._metric_provider_cache.keys()) == {
+        "table.column_types",
+        "table.columns",
+    }
+    assert engine._metric_provider_cache["table.columns"] == get_metric_provider(
+        metric_name="table.columns", execution_engine=engine
+    )
+
+
+def test_resolve_metrics_without_caching_leaves_metric_cache_empty():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(caching=False, batch_data_dict={"my_id": df})
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+
+    assert results[table_columns_metric.id] == ["a"]
+    assert engine._metric_cache == {}
+
+
 def test_resolve_metrics_with_extraneous_value_key():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
     engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
@@ -213,3 +248,55 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(GreatExpectationsError) as error:
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+def test_resolve_data_reference():
+    e = PandasExecutionEngine()
+
+    assert (
+        e.resolve_data_reference(
+            data_connector_name="InferredAssetS3DataConnector",
+            template_arguments={"bucket": "my_bucket", "path": "my/path/file.csv"},
+        )
+        == "s3a://my_bucket/my/path/file.csv"
+    )
+
+    # Ensuring that an unsupported (data_connector_name, execution_engine_name) combination yields an error
+    with pytest.raises(GreatExpectationsError):
+        e.resolve_data_reference(
+            data_connector_name="InferredAssetFilesystemDataConnector",
+            template_arguments={},
+        )
+
+
+def test_config_filters_out_falsy_values_but_retains_falsy_numerics():
+    e = PandasExecutionEngine(caching=False, batch_spec_defaults={})
+
+    assert e.config == {
+        "caching": False,
+        "class_name": "PandasExecutionEngine",
+        "module_name": "great_expectations.execution_engine.pandas_execution_engine",
+        "discard_subset_failing_expectations": False,
+        "boto3_options": {},
+        "azure_options": {},
+        "gcs_options": {},
+    }
+
+
+def test_split_table_metric_domain_kwargs_with_accessor_keys_iterator():
+    engine = PandasExecutionEngine()
+    domain_kwargs: dict = {"batch_id": "1234", "column": "a"}
+
+    compute_domain_kwargs: dict
+    accessor_domain_kwargs: dict
+    (
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    ) = engine._split_table_metric_domain_kwargs(
+        domain_kwargs=domain_kwargs,
+        domain_type="table",
+        accessor_keys=(key for key in ["column"]),
+    )
+    assert compute_domain_kwargs == {"batch_id": "1234"}
+    assert accessor_domain_kwargs == {"column": "a"}
+    assert domain_kwargs == {"batch_id": "1234", "column": "a"}
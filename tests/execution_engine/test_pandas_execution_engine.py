@@ -577,6 +577,155 @@ def test_resolve_metric_bundle():
     )
 
 
+# Metrics sharing a metric domain should only query the batch once
+def test_resolve_metric_group_queries_metric_domain_once():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [2, 3, 4, 5]})
+
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    metric_domain_kwargs: dict = {
+        "column": "a",
+        "row_condition": "b > 2",
+        "condition_parser": "pandas",
+    }
+    column_min = MetricConfiguration(
+        metric_name="column.min",
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    column_max = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    with mock.patch.object(
+        pd.DataFrame, "query", autospec=True, side_effect=pd.DataFrame.query
+    ) as mock_query:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=(column_min, column_max), metrics=metrics
+        )
+
+    assert mock_query.call_count == 1
+    assert results[column_min.id] == 2.0
+    assert results[column_max.id] == 3.0
+    assert engine._domain_records_cache is None
+
+
+# Metrics on different columns, filtered by the same row condition, should only query the batch once
+def test_resolve_metric_group_queries_row_condition_once():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [2, 3, 4, 5]})
+
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    column_a_max = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={
+            "column": "a",
+            "row_condition": "b > 2",
+            "condition_parser": "pandas",
+        },
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    column_b_min = MetricConfiguration(
+        metric_name="column.min",
+        metric_domain_kwargs={
+            "column": "b",
+            "row_condition": "b > 2",
+            "condition_parser": "pandas",
+        },
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    with mock.patch.object(
+        pd.DataFrame, "query", autospec=True, side_effect=pd.DataFrame.query
+    ) as mock_query:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=(column_a_max, column_b_min), metrics=metrics
+        )
+
+    assert mock_query.call_count == 1
+    assert results[column_a_max.id] == 3.0
+    assert results[column_b_min.id] == 3
+    assert engine._domain_records_cache is None
+
+
+# Metrics sharing a row condition query result should not see each other's modifications of the domain records
+def test_resolve_metric_group_isolates_queried_domain_records():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [2, 3, 4, 5]})
+
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    metric_domain_kwargs: dict = {
+        "row_condition": "b > 2",
+        "condition_parser": "pandas",
+    }
+
+    def modify_domain_records():
+        data: pd.DataFrame = engine.get_domain_records(
+            domain_kwargs=metric_domain_kwargs
+        )
+        data["a"] = 0
+        return data["a"].sum()
+
+    def sum_domain_records():
+        data: pd.DataFrame = engine.get_domain_records(
+            domain_kwargs=metric_domain_kwargs
+        )
+        return data["a"].sum()
+
+    table_row_count = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=None,
+    )
+    table_columns = MetricConfiguration(
+        metric_name="table.columns",
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=None,
+    )
+    with mock.patch.object(
+        pd.DataFrame, "query", autospec=True, side_effect=pd.DataFrame.query
+    ) as mock_query:
+        results = engine.resolve_metric_group(
+            metric_fn_group=[
+                (table_row_count, modify_domain_records, {}),
+                (table_columns, sum_domain_records, {}),
+            ]
+        )
+
+    assert mock_query.call_count == 1
+    assert results[table_row_count.id] == 0
+    assert results[table_columns.id] == 5.0
+    assert df["a"].sum() == 6.0
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error
 def test_resolve_metric_bundle_with_nonexistent_metric():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
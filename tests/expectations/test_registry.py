@@ -1,8 +1,22 @@
+from typing import Callable
+
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.execution_engine import (
+    MetricPartialFunctionTypes,
+)
 from great_expectations.expectations.core.expect_column_values_to_be_in_set import (
     ExpectColumnValuesToBeInSet,
 )
-from great_expectations.expectations.registry import get_expectation_impl
+from great_expectations.expectations.registry import (
+    _METRIC_FN_KIND_PARTIAL,
+    _METRIC_FN_KIND_VALUE,
+    get_expectation_impl,
+    get_metric_provider,
+)
 
 
 def test_registry_basics():
@@ -16,3 +30,23 @@ def test_registry_from_configuration():
         kwargs={"column": "PClass", "value_set": [1, 2, 3]},
     )
     assert configuration._get_expectation_impl() == ExpectColumnValuesToBeInSet
+
+
+def test_registered_metric_functions_are_tagged_with_their_kind(sa):
+    metric_fn: Callable
+
+    pandas_execution_engine = PandasExecutionEngine()
+    _, metric_fn = get_metric_provider(
+        metric_name="column.max", execution_engine=pandas_execution_engine
+    )
+    assert metric_fn.metric_fn_kind == _METRIC_FN_KIND_VALUE
+
+    sqlalchemy_execution_engine = SqlAlchemyExecutionEngine(
+        connection_string="sqlite://"
+    )
+    _, metric_fn = get_metric_provider(
+        metric_name="column.max.aggregate_fn",
+        execution_engine=sqlalchemy_execution_engine,
+    )
+    assert metric_fn.metric_fn_type == MetricPartialFunctionTypes.AGGREGATE_FN
+    assert metric_fn.metric_fn_kind == _METRIC_FN_KIND_PARTIAL
@@ -1,7 +1,9 @@
 from typing import List
 
+import pytest
 from ruamel.yaml import YAML
 
+import great_expectations.exceptions as ge_exceptions
 from great_expectations import DataContext
 from great_expectations.rule_based_profiler.domain_builder import (
     ColumnDomainBuilder,
@@ -133,6 +135,38 @@ def test_column_domain_builder(
     ]
 
 
+def test_column_domain_builder_get_effective_column_names(
+    alice_columnar_table_single_batch_context,
+):
+    data_context: DataContext = alice_columnar_table_single_batch_context
+
+    batch_request: dict = {
+        "datasource_name": "alice_columnar_table_single_batch_datasource",
+        "data_connector_name": "alice_columnar_table_single_batch_data_connector",
+        "data_asset_name": "alice_columnar_table_single_batch_data_asset",
+    }
+
+    domain_builder: ColumnDomainBuilder = ColumnDomainBuilder(
+        data_context=data_context,
+        batch_request=batch_request,
+    )
+
+    assert domain_builder.get_effective_column_names(
+        include_columns=["id", "event_type", "user_id"],
+        exclude_columns=["event_type"],
+    ) == ["id", "user_id"]
+
+    with pytest.raises(ge_exceptions.ProfilerExecutionError) as e:
+        domain_builder.get_effective_column_names(
+            include_columns=["id", "non_existent_column"],
+        )
+
+    assert (
+        e.value.message
+        == 'Error: The column "non_existent_column" in BatchData does not exist.'
+    )
+
+
 # noinspection PyPep8Naming
 def test_simple_semantic_type_column_domain_builder(
     alice_columnar_table_single_batch_context,
@@ -1,4 +1,5 @@
-from typing import List
+from typing import Dict, List, Tuple
+from unittest import mock
 
 from great_expectations import DataContext
 from great_expectations.core.batch import BatchRequest
@@ -367,3 +368,68 @@ def test_column_values_nonnull_multi_batch_all_columns_emitted_loose_max_unexpec
 
     assert len(domains) == 18
     assert domains == bobby_expected_column_domains
+
+
+def test_get_column_names_satisfying_tolerance_limits():
+    # "unexpected_count" values of three columns over four Batch objects, each having 10 records on average.
+    resolved_metrics_by_column_name: Dict[str, Dict[Tuple[str, str, str], int]] = {
+        "a": {("m", f"batch_id={idx}", ()): 0 for idx in range(4)},
+        "b": {
+            ("m", f"batch_id={idx}", ()): value
+            for idx, value in enumerate([0, 1, 0, 2])
+        },
+        "c": {
+            ("m", f"batch_id={idx}", ()): value
+            for idx, value in enumerate([3, 1, 5, 2])
+        },
+    }
+
+    assert MapMetricColumnDomainBuilder._get_column_names_satisfying_tolerance_limits(
+        num_batch_ids=4,
+        resolved_metrics_by_column_name=resolved_metrics_by_column_name,
+        mean_table_row_count_as_float=10.0,
+        max_unexpected_ratio=0.0,
+        min_max_unexpected_values_proportion=0.5,
+    ) == ["a", "b"]
+    assert MapMetricColumnDomainBuilder._get_column_names_satisfying_tolerance_limits(
+        num_batch_ids=4,
+        resolved_metrics_by_column_name=resolved_metrics_by_column_name,
+        mean_table_row_count_as_float=10.0,
+        max_unexpected_ratio=0.1,
+        min_max_unexpected_values_proportion=9.75e-1,
+    ) == ["a"]
+    assert MapMetricColumnDomainBuilder._get_column_names_satisfying_tolerance_limits(
+        num_batch_ids=4,
+        resolved_metrics_by_column_name=resolved_metrics_by_column_name,
+        mean_table_row_count_as_float=10.0,
+        max_unexpected_ratio=0.5,
+        min_max_unexpected_values_proportion=0.75,
+    ) == ["a", "b", "c"]
+
+
+def test_unattainable_min_max_unexpected_values_proportion_skips_metric_resolution(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    batch_request: BatchRequest = BatchRequest(
+        datasource_name="taxi_pandas",
+        data_connector_name="monthly",
+        data_asset_name="my_reports",
+    )
+
+    domain_builder: MapMetricColumnDomainBuilder = MapMetricColumnDomainBuilder(
+        map_metric_name="column_values.nonnull",
+        batch_request=batch_request,
+        data_context=data_context,
+        min_max_unexpected_values_proportion=1.01,
+    )
+    with mock.patch(
+        "great_expectations.rule_based_profiler.domain_builder.map_metric_column_domain_builder.get_resolved_metrics_by_key",
+    ) as mock_get_resolved_metrics_by_key:
+        domains: List[Domain] = domain_builder.get_domains()
+
+    assert domains == []
+    mock_get_resolved_metrics_by_key.assert_not_called()
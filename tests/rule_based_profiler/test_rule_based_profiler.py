@@ -1,7 +1,7 @@
 import logging
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 from unittest import mock
-from unittest.mock import MagicMock
 
 import pandas as pd
 import pytest
@@ -25,8 +25,103 @@ from great_expectations.rule_based_profiler.rule_based_profiler import (
 from great_expectations.rule_based_profiler.types import ParameterContainer
 from great_expectations.util import deep_filter_properties_iterable
 
+# Canonical (reconciled and serialized) configurations of builders, shared by "reconcile_profiler_rules" expectations.
+_DB_COLUMN: Mapping[str, Any] = MappingProxyType(
+    {
+        "class_name": "ColumnDomainBuilder",
+        "module_name": "great_expectations.rule_based_profiler.domain_builder.column_domain_builder",
+    }
+)
+
+_DB_TABLE: Mapping[str, Any] = MappingProxyType(
+    {
+        "class_name": "TableDomainBuilder",
+        "module_name": "great_expectations.rule_based_profiler.domain_builder.table_domain_builder",
+    }
+)
+
+_PB_MY_PARAMETER: Mapping[str, Any] = MappingProxyType(
+    {
+        "class_name": "MetricMultiBatchParameterBuilder",
+        "module_name": "great_expectations.rule_based_profiler.parameter_builder.metric_multi_batch_parameter_builder",
+        "name": "my_parameter",
+        "metric_name": "my_metric",
+        "enforce_numeric_metric": False,
+        "replace_nan_with_zero": False,
+        "reduce_scalar_metric": True,
+        "json_serialize": True,
+    }
+)
+
+_PB_MY_OTHER_PARAMETER: Mapping[str, Any] = MappingProxyType(
+    {
+        "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
+        "module_name": "great_expectations.rule_based_profiler.parameter_builder.numeric_metric_range_multi_batch_parameter_builder",
+        "name": "my_other_parameter",
+        "metric_name": "my_other_metric",
+        "sampling_method": "bootstrap",
+        "enforce_numeric_metric": True,
+        "replace_nan_with_zero": True,
+        "reduce_scalar_metric": True,
+        "false_positive_rate": 0.05,
+        "truncate_values": {},
+        "json_serialize": True,
+    }
+)
+
+_ECB_PAIR_AB: Mapping[str, Any] = MappingProxyType(
+    {
+        "class_name": "DefaultExpectationConfigurationBuilder",
+        "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
+        "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
+        "column_A": "$domain.domain_kwargs.column_A",
+        "column_B": "$domain.domain_kwargs.column_B",
+        "my_arg": "$parameter.my_parameter.value[0]",
+        "my_other_arg": "$parameter.my_parameter.value[1]",
+        "meta": {
+            "details": {
+                "my_parameter_estimator": "$parameter.my_parameter.details",
+                "note": "Important remarks about estimation algorithm.",
+            },
+        },
+    }
+)
 
-@pytest.fixture()
+_ECB_PAIR_AB_ONE_ARG: Mapping[str, Any] = MappingProxyType(
+    {
+        "class_name": "DefaultExpectationConfigurationBuilder",
+        "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
+        "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
+        "column_A": "$domain.domain_kwargs.column_A",
+        "column_B": "$domain.domain_kwargs.column_B",
+        "my_one_arg": "$parameter.my_parameter.value[0]",
+        "meta": {
+            "details": {
+                "my_parameter_estimator": "$parameter.my_parameter.details",
+                "note": "Important remarks about estimation algorithm.",
+            },
+        },
+    }
+)
+
+_ECB_MIN: Mapping[str, Any] = MappingProxyType(
+    {
+        "class_name": "DefaultExpectationConfigurationBuilder",
+        "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
+        "expectation_type": "expect_column_min_to_be_between",
+        "column": "$domain.domain_kwargs.column",
+        "my_another_arg": "$parameter.my_other_parameter.value[0]",
+        "meta": {
+            "details": {
+                "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
+                "note": "Important remarks about estimation algorithm.",
+            },
+        },
+    }
+)
+
+
+@pytest.fixture(scope="module")
 def sample_rule_dict():
     return {
         "domain_builder": {
@@ -99,798 +194,433 @@ def test_reconcile_profiler_rules_no_overrides(
     assert effective_rules == profiler_with_placeholder_args.rules
 
 
-def test_reconcile_profiler_rules_new_rule_override(
-    profiler_with_placeholder_args,
-):
-    rules: Dict[str, Dict[str, Any]] = {
-        "rule_0": {
-            "domain_builder": {
-                "class_name": "ColumnDomainBuilder",
-                "module_name": "great_expectations.rule_based_profiler.domain_builder",
-            },
-            "parameter_builders": [
-                {
-                    "class_name": "MetricMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder",
-                    "name": "my_parameter",
-                    "metric_name": "my_metric",
-                    "json_serialize": True,
-                },
-                {
-                    "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder",
-                    "name": "my_other_parameter",
-                    "metric_name": "my_other_metric",
-                    "json_serialize": True,
-                },
-            ],
-            "expectation_configuration_builders": [
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
-                    "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
-                    "column_A": "$domain.domain_kwargs.column_A",
-                    "column_B": "$domain.domain_kwargs.column_B",
-                    "my_one_arg": "$parameter.my_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_parameter_estimator": "$parameter.my_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
-                        },
+@pytest.mark.parametrize(
+    "rules,reconciliation_directives,expected_rules",
+    [
+        pytest.param(
+            {
+                "rule_0": {
+                    "domain_builder": {
+                        "class_name": "ColumnDomainBuilder",
+                        "module_name": "great_expectations.rule_based_profiler.domain_builder",
                     },
-                },
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
-                    "expectation_type": "expect_column_min_to_be_between",
-                    "column": "$domain.domain_kwargs.column",
-                    "my_another_arg": "$parameter.my_other_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
+                    "parameter_builders": [
+                        {
+                            "class_name": "MetricMultiBatchParameterBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.parameter_builder",
+                            "name": "my_parameter",
+                            "metric_name": "my_metric",
+                            "json_serialize": True,
                         },
-                    },
-                },
-            ],
-        },
-    }
-
-    expected_rules: Dict[str, dict] = {
-        "rule_0": {
-            "domain_builder": {
-                "class_name": "ColumnDomainBuilder",
-                "module_name": "great_expectations.rule_based_profiler.domain_builder.column_domain_builder",
-            },
-            "parameter_builders": [
-                {
-                    "class_name": "MetricMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder.metric_multi_batch_parameter_builder",
-                    "name": "my_parameter",
-                    "metric_name": "my_metric",
-                    "enforce_numeric_metric": False,
-                    "replace_nan_with_zero": False,
-                    "reduce_scalar_metric": True,
-                    "json_serialize": True,
-                },
-                {
-                    "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder.numeric_metric_range_multi_batch_parameter_builder",
-                    "name": "my_other_parameter",
-                    "metric_name": "my_other_metric",
-                    "sampling_method": "bootstrap",
-                    "enforce_numeric_metric": True,
-                    "replace_nan_with_zero": True,
-                    "reduce_scalar_metric": True,
-                    "false_positive_rate": 0.05,
-                    "truncate_values": {},
-                    "json_serialize": True,
-                },
-            ],
-            "expectation_configuration_builders": [
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
-                    "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
-                    "column_A": "$domain.domain_kwargs.column_A",
-                    "column_B": "$domain.domain_kwargs.column_B",
-                    "my_one_arg": "$parameter.my_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_parameter_estimator": "$parameter.my_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
+                        {
+                            "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.parameter_builder",
+                            "name": "my_other_parameter",
+                            "metric_name": "my_other_metric",
+                            "json_serialize": True,
                         },
-                    },
-                },
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
-                    "expectation_type": "expect_column_min_to_be_between",
-                    "column": "$domain.domain_kwargs.column",
-                    "my_another_arg": "$parameter.my_other_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
+                    ],
+                    "expectation_configuration_builders": [
+                        {
+                            "class_name": "DefaultExpectationConfigurationBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
+                            "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
+                            "column_A": "$domain.domain_kwargs.column_A",
+                            "column_B": "$domain.domain_kwargs.column_B",
+                            "my_one_arg": "$parameter.my_parameter.value[0]",
+                            "meta": {
+                                "details": {
+                                    "my_parameter_estimator": "$parameter.my_parameter.details",
+                                    "note": "Important remarks about estimation algorithm.",
+                                },
+                            },
                         },
-                    },
+                        {
+                            "class_name": "DefaultExpectationConfigurationBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
+                            "expectation_type": "expect_column_min_to_be_between",
+                            "column": "$domain.domain_kwargs.column",
+                            "my_another_arg": "$parameter.my_other_parameter.value[0]",
+                            "meta": {
+                                "details": {
+                                    "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
+                                    "note": "Important remarks about estimation algorithm.",
+                                },
+                            },
+                        },
+                    ],
                 },
-            ],
-        },
-        "rule_1": {
-            "domain_builder": {
-                "class_name": "TableDomainBuilder",
-                "module_name": "great_expectations.rule_based_profiler.domain_builder.table_domain_builder",
             },
-            "parameter_builders": [
-                {
-                    "class_name": "MetricMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder.metric_multi_batch_parameter_builder",
-                    "name": "my_parameter",
-                    "metric_name": "my_metric",
-                    "enforce_numeric_metric": False,
-                    "replace_nan_with_zero": False,
-                    "reduce_scalar_metric": True,
-                    "json_serialize": True,
+            RuleBasedProfiler.DEFAULT_RECONCILATION_DIRECTIVES,
+            {
+                "rule_0": {
+                    "domain_builder": _DB_COLUMN,
+                    "parameter_builders": [
+                        _PB_MY_PARAMETER,
+                        _PB_MY_OTHER_PARAMETER,
+                    ],
+                    "expectation_configuration_builders": [
+                        _ECB_PAIR_AB_ONE_ARG,
+                        _ECB_MIN,
+                    ],
                 },
-            ],
-            "expectation_configuration_builders": [
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
-                    "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
-                    "column_A": "$domain.domain_kwargs.column_A",
-                    "column_B": "$domain.domain_kwargs.column_B",
-                    "my_arg": "$parameter.my_parameter.value[0]",
-                    "my_other_arg": "$parameter.my_parameter.value[1]",
-                    "meta": {
-                        "details": {
-                            "my_parameter_estimator": "$parameter.my_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
-                        },
-                    },
+                "rule_1": {
+                    "domain_builder": _DB_TABLE,
+                    "parameter_builders": [
+                        _PB_MY_PARAMETER,
+                    ],
+                    "expectation_configuration_builders": [
+                        _ECB_PAIR_AB,
+                    ],
                 },
-            ],
-        },
-    }
-
-    effective_rules: List[
-        Rule
-    ] = profiler_with_placeholder_args.reconcile_profiler_rules(rules=rules)
-
-    rule: Rule
-    effective_rule_configs_actual: Dict[str, dict] = {
-        rule.name: rule.to_json_dict() for rule in effective_rules
-    }
-    deep_filter_properties_iterable(effective_rule_configs_actual, inplace=True)
-
-    assert effective_rule_configs_actual == expected_rules
-
-
-def test_reconcile_profiler_rules_existing_rule_domain_builder_override(
-    profiler_with_placeholder_args,
-):
-    rules: Dict[str, Dict[str, Any]] = {
-        "rule_1": {
-            "domain_builder": {
-                "class_name": "SimpleColumnSuffixDomainBuilder",
-                "module_name": "great_expectations.rule_based_profiler.domain_builder",
-                "column_name_suffixes": [
-                    "_ts",
-                ],
-            },
-        },
-    }
-
-    expected_rules: Dict[str, dict] = {
-        "rule_1": {
-            "domain_builder": {
-                "class_name": "SimpleColumnSuffixDomainBuilder",
-                "module_name": "great_expectations.rule_based_profiler.domain_builder.simple_column_suffix_domain_builder",
-                "column_name_suffixes": [
-                    "_ts",
-                ],
             },
-            "parameter_builders": [
-                {
-                    "class_name": "MetricMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder.metric_multi_batch_parameter_builder",
-                    "name": "my_parameter",
-                    "metric_name": "my_metric",
-                    "enforce_numeric_metric": False,
-                    "replace_nan_with_zero": False,
-                    "reduce_scalar_metric": True,
-                    "json_serialize": True,
-                },
-            ],
-            "expectation_configuration_builders": [
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
-                    "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
-                    "column_A": "$domain.domain_kwargs.column_A",
-                    "column_B": "$domain.domain_kwargs.column_B",
-                    "my_arg": "$parameter.my_parameter.value[0]",
-                    "my_other_arg": "$parameter.my_parameter.value[1]",
-                    "meta": {
-                        "details": {
-                            "my_parameter_estimator": "$parameter.my_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
-                        },
+            id="new_rule_override",
+        ),
+        pytest.param(
+            {
+                "rule_1": {
+                    "domain_builder": {
+                        "class_name": "SimpleColumnSuffixDomainBuilder",
+                        "module_name": "great_expectations.rule_based_profiler.domain_builder",
+                        "column_name_suffixes": [
+                            "_ts",
+                        ],
                     },
                 },
-            ],
-        },
-    }
-
-    effective_rules: List[
-        Rule
-    ] = profiler_with_placeholder_args.reconcile_profiler_rules(rules=rules)
-
-    rule: Rule
-    effective_rule_configs_actual: Dict[str, dict] = {
-        rule.name: rule.to_json_dict() for rule in effective_rules
-    }
-    deep_filter_properties_iterable(effective_rule_configs_actual, inplace=True)
-
-    assert effective_rule_configs_actual == expected_rules
-
-
-def test_reconcile_profiler_rules_existing_rule_parameter_builder_overrides(
-    profiler_with_placeholder_args,
-):
-    rules: Dict[str, Dict[str, Any]] = {
-        "rule_1": {
-            "parameter_builders": [
-                {
-                    "class_name": "MetricMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder",
-                    "name": "my_parameter",
-                    "metric_name": "my_special_metric",
-                    "enforce_numeric_metric": True,
-                    "replace_nan_with_zero": True,
-                    "reduce_scalar_metric": True,
-                    "json_serialize": True,
-                },
-                {
-                    "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder",
-                    "name": "my_other_parameter",
-                    "metric_name": "my_other_metric",
-                    "enforce_numeric_metric": True,
-                    "replace_nan_with_zero": False,
-                    "reduce_scalar_metric": True,
-                    "false_positive_rate": 0.025,
-                    "json_serialize": True,
-                },
-            ],
-        },
-    }
-
-    expected_rules: Dict[str, dict] = {
-        "rule_1": {
-            "domain_builder": {
-                "class_name": "TableDomainBuilder",
-                "module_name": "great_expectations.rule_based_profiler.domain_builder.table_domain_builder",
             },
-            "parameter_builders": [
-                {
-                    "class_name": "MetricMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder.metric_multi_batch_parameter_builder",
-                    "name": "my_parameter",
-                    "metric_name": "my_special_metric",
-                    "enforce_numeric_metric": True,
-                    "replace_nan_with_zero": True,
-                    "reduce_scalar_metric": True,
-                    "json_serialize": True,
-                },
-                {
-                    "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder.numeric_metric_range_multi_batch_parameter_builder",
-                    "name": "my_other_parameter",
-                    "metric_name": "my_other_metric",
-                    "sampling_method": "bootstrap",
-                    "enforce_numeric_metric": True,
-                    "replace_nan_with_zero": False,
-                    "reduce_scalar_metric": True,
-                    "false_positive_rate": 0.025,
-                    "truncate_values": {},
-                    "json_serialize": True,
-                },
-            ],
-            "expectation_configuration_builders": [
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
-                    "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
-                    "column_A": "$domain.domain_kwargs.column_A",
-                    "column_B": "$domain.domain_kwargs.column_B",
-                    "my_arg": "$parameter.my_parameter.value[0]",
-                    "my_other_arg": "$parameter.my_parameter.value[1]",
-                    "meta": {
-                        "details": {
-                            "my_parameter_estimator": "$parameter.my_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
-                        },
+            RuleBasedProfiler.DEFAULT_RECONCILATION_DIRECTIVES,
+            {
+                "rule_1": {
+                    "domain_builder": {
+                        "class_name": "SimpleColumnSuffixDomainBuilder",
+                        "module_name": "great_expectations.rule_based_profiler.domain_builder.simple_column_suffix_domain_builder",
+                        "column_name_suffixes": [
+                            "_ts",
+                        ],
                     },
+                    "parameter_builders": [
+                        _PB_MY_PARAMETER,
+                    ],
+                    "expectation_configuration_builders": [
+                        _ECB_PAIR_AB,
+                    ],
                 },
-            ],
-        },
-    }
-
-    effective_rules: List[
-        Rule
-    ] = profiler_with_placeholder_args.reconcile_profiler_rules(rules=rules)
-
-    rule: Rule
-    effective_rule_configs_actual: Dict[str, dict] = {
-        rule.name: rule.to_json_dict() for rule in effective_rules
-    }
-    deep_filter_properties_iterable(effective_rule_configs_actual, inplace=True)
-
-    assert effective_rule_configs_actual == expected_rules
-
-
-def test_reconcile_profiler_rules_existing_rule_expectation_configuration_builder_overrides(
-    profiler_with_placeholder_args,
-):
-    rules: Dict[str, Dict[str, Any]] = {
-        "rule_1": {
-            "expectation_configuration_builders": [
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
-                    "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
-                    "column_A": "$domain.domain_kwargs.column_A",
-                    "column_B": "$domain.domain_kwargs.column_B",
-                    "my_one_arg": "$parameter.my_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_parameter_estimator": "$parameter.my_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
+            },
+            id="existing_rule_domain_builder_override",
+        ),
+        pytest.param(
+            {
+                "rule_1": {
+                    "parameter_builders": [
+                        {
+                            "class_name": "MetricMultiBatchParameterBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.parameter_builder",
+                            "name": "my_parameter",
+                            "metric_name": "my_special_metric",
+                            "enforce_numeric_metric": True,
+                            "replace_nan_with_zero": True,
+                            "reduce_scalar_metric": True,
+                            "json_serialize": True,
                         },
-                    },
-                },
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
-                    "expectation_type": "expect_column_min_to_be_between",
-                    "column": "$domain.domain_kwargs.column",
-                    "my_another_arg": "$parameter.my_other_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
+                        {
+                            "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.parameter_builder",
+                            "name": "my_other_parameter",
+                            "metric_name": "my_other_metric",
+                            "enforce_numeric_metric": True,
+                            "replace_nan_with_zero": False,
+                            "reduce_scalar_metric": True,
+                            "false_positive_rate": 0.025,
+                            "json_serialize": True,
                         },
-                    },
+                    ],
                 },
-            ],
-        },
-    }
-
-    expected_rules: Dict[str, dict] = {
-        "rule_1": {
-            "domain_builder": {
-                "class_name": "TableDomainBuilder",
-                "module_name": "great_expectations.rule_based_profiler.domain_builder.table_domain_builder",
             },
-            "parameter_builders": [
-                {
-                    "class_name": "MetricMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder.metric_multi_batch_parameter_builder",
-                    "name": "my_parameter",
-                    "metric_name": "my_metric",
-                    "enforce_numeric_metric": False,
-                    "replace_nan_with_zero": False,
-                    "reduce_scalar_metric": True,
-                    "json_serialize": True,
-                },
-            ],
-            "expectation_configuration_builders": [
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
-                    "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
-                    "column_A": "$domain.domain_kwargs.column_A",
-                    "column_B": "$domain.domain_kwargs.column_B",
-                    "my_one_arg": "$parameter.my_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_parameter_estimator": "$parameter.my_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
+            RuleBasedProfiler.DEFAULT_RECONCILATION_DIRECTIVES,
+            {
+                "rule_1": {
+                    "domain_builder": _DB_TABLE,
+                    "parameter_builders": [
+                        {
+                            **_PB_MY_PARAMETER,
+                            "metric_name": "my_special_metric",
+                            "enforce_numeric_metric": True,
+                            "replace_nan_with_zero": True,
                         },
-                    },
-                },
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
-                    "expectation_type": "expect_column_min_to_be_between",
-                    "column": "$domain.domain_kwargs.column",
-                    "my_another_arg": "$parameter.my_other_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
+                        {
+                            **_PB_MY_OTHER_PARAMETER,
+                            "replace_nan_with_zero": False,
+                            "false_positive_rate": 0.025,
                         },
-                    },
+                    ],
+                    "expectation_configuration_builders": [
+                        _ECB_PAIR_AB,
+                    ],
                 },
-            ],
-        },
-    }
-
-    effective_rules: List[
-        Rule
-    ] = profiler_with_placeholder_args.reconcile_profiler_rules(rules=rules)
-
-    rule: Rule
-    effective_rule_configs_actual: Dict[str, dict] = {
-        rule.name: rule.to_json_dict() for rule in effective_rules
-    }
-    deep_filter_properties_iterable(effective_rule_configs_actual, inplace=True)
-
-    assert effective_rule_configs_actual == expected_rules
-
-
-def test_reconcile_profiler_rules_existing_rule_full_rule_override_nested_update(
-    profiler_with_placeholder_args,
-):
-    rules: Dict[str, Dict[str, Any]] = {
-        "rule_1": {
-            "domain_builder": {
-                "class_name": "ColumnDomainBuilder",
-                "module_name": "great_expectations.rule_based_profiler.domain_builder",
             },
-            "parameter_builders": [
-                {
-                    "class_name": "MetricMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder",
-                    "name": "my_parameter",
-                    "metric_name": "my_metric",
-                    "json_serialize": True,
-                },
-                {
-                    "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder",
-                    "name": "my_other_parameter",
-                    "metric_name": "my_other_metric",
-                    "json_serialize": True,
-                },
-            ],
-            "expectation_configuration_builders": [
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
-                    "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
-                    "column_A": "$domain.domain_kwargs.column_A",
-                    "column_B": "$domain.domain_kwargs.column_B",
-                    "my_one_arg": "$parameter.my_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_parameter_estimator": "$parameter.my_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
+            id="existing_rule_parameter_builder_overrides",
+        ),
+        pytest.param(
+            {
+                "rule_1": {
+                    "expectation_configuration_builders": [
+                        {
+                            "class_name": "DefaultExpectationConfigurationBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
+                            "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
+                            "column_A": "$domain.domain_kwargs.column_A",
+                            "column_B": "$domain.domain_kwargs.column_B",
+                            "my_one_arg": "$parameter.my_parameter.value[0]",
+                            "meta": {
+                                "details": {
+                                    "my_parameter_estimator": "$parameter.my_parameter.details",
+                                    "note": "Important remarks about estimation algorithm.",
+                                },
+                            },
                         },
-                    },
-                },
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
-                    "expectation_type": "expect_column_min_to_be_between",
-                    "column": "$domain.domain_kwargs.column",
-                    "my_another_arg": "$parameter.my_other_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
+                        {
+                            "class_name": "DefaultExpectationConfigurationBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
+                            "expectation_type": "expect_column_min_to_be_between",
+                            "column": "$domain.domain_kwargs.column",
+                            "my_another_arg": "$parameter.my_other_parameter.value[0]",
+                            "meta": {
+                                "details": {
+                                    "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
+                                    "note": "Important remarks about estimation algorithm.",
+                                },
+                            },
                         },
-                    },
+                    ],
                 },
-            ],
-        },
-    }
-
-    expected_rules: Dict[str, dict] = {
-        "rule_1": {
-            "domain_builder": {
-                "class_name": "ColumnDomainBuilder",
-                "module_name": "great_expectations.rule_based_profiler.domain_builder.column_domain_builder",
             },
-            "parameter_builders": [
-                {
-                    "class_name": "MetricMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder.metric_multi_batch_parameter_builder",
-                    "name": "my_parameter",
-                    "metric_name": "my_metric",
-                    "enforce_numeric_metric": False,
-                    "replace_nan_with_zero": False,
-                    "reduce_scalar_metric": True,
-                    "json_serialize": True,
-                },
-                {
-                    "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder.numeric_metric_range_multi_batch_parameter_builder",
-                    "name": "my_other_parameter",
-                    "metric_name": "my_other_metric",
-                    "sampling_method": "bootstrap",
-                    "enforce_numeric_metric": True,
-                    "replace_nan_with_zero": True,
-                    "reduce_scalar_metric": True,
-                    "false_positive_rate": 0.05,
-                    "truncate_values": {},
-                    "json_serialize": True,
+            RuleBasedProfiler.DEFAULT_RECONCILATION_DIRECTIVES,
+            {
+                "rule_1": {
+                    "domain_builder": _DB_TABLE,
+                    "parameter_builders": [
+                        _PB_MY_PARAMETER,
+                    ],
+                    "expectation_configuration_builders": [
+                        _ECB_PAIR_AB_ONE_ARG,
+                        _ECB_MIN,
+                    ],
                 },
-            ],
-            "expectation_configuration_builders": [
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
-                    "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
-                    "column_A": "$domain.domain_kwargs.column_A",
-                    "column_B": "$domain.domain_kwargs.column_B",
-                    "my_arg": "$parameter.my_parameter.value[0]",
-                    "my_other_arg": "$parameter.my_parameter.value[1]",
-                    "my_one_arg": "$parameter.my_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_parameter_estimator": "$parameter.my_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
-                        },
+            },
+            id="existing_rule_expectation_configuration_builder_overrides",
+        ),
+        pytest.param(
+            {
+                "rule_1": {
+                    "domain_builder": {
+                        "class_name": "ColumnDomainBuilder",
+                        "module_name": "great_expectations.rule_based_profiler.domain_builder",
                     },
-                },
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
-                    "expectation_type": "expect_column_min_to_be_between",
-                    "column": "$domain.domain_kwargs.column",
-                    "my_another_arg": "$parameter.my_other_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
+                    "parameter_builders": [
+                        {
+                            "class_name": "MetricMultiBatchParameterBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.parameter_builder",
+                            "name": "my_parameter",
+                            "metric_name": "my_metric",
+                            "json_serialize": True,
                         },
-                    },
-                },
-            ],
-        },
-    }
-
-    effective_rules: List[
-        Rule
-    ] = profiler_with_placeholder_args.reconcile_profiler_rules(
-        rules=rules,
-        reconciliation_directives=ReconciliationDirectives(
-            domain_builder=ReconciliationStrategy.UPDATE,
-            parameter_builder=ReconciliationStrategy.UPDATE,
-            expectation_configuration_builder=ReconciliationStrategy.NESTED_UPDATE,
-        ),
-    )
-
-    rule: Rule
-    effective_rule_configs_actual: Dict[str, dict] = {
-        rule.name: rule.to_json_dict() for rule in effective_rules
-    }
-    deep_filter_properties_iterable(effective_rule_configs_actual, inplace=True)
-
-    assert effective_rule_configs_actual == expected_rules
-
-
-def test_reconcile_profiler_rules_existing_rule_full_rule_override_replace(
-    profiler_with_placeholder_args,
-):
-    rules: Dict[str, Dict[str, Any]] = {
-        "rule_1": {
-            "domain_builder": {
-                "class_name": "ColumnDomainBuilder",
-                "module_name": "great_expectations.rule_based_profiler.domain_builder",
-            },
-            "parameter_builders": [
-                {
-                    "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder",
-                    "name": "my_other_parameter",
-                    "metric_name": "my_other_metric",
-                    "json_serialize": True,
-                },
-            ],
-            "expectation_configuration_builders": [
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
-                    "expectation_type": "expect_column_min_to_be_between",
-                    "column": "$domain.domain_kwargs.column",
-                    "my_another_arg": "$parameter.my_other_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
+                        {
+                            "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.parameter_builder",
+                            "name": "my_other_parameter",
+                            "metric_name": "my_other_metric",
+                            "json_serialize": True,
                         },
-                    },
+                    ],
+                    "expectation_configuration_builders": [
+                        {
+                            "class_name": "DefaultExpectationConfigurationBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
+                            "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
+                            "column_A": "$domain.domain_kwargs.column_A",
+                            "column_B": "$domain.domain_kwargs.column_B",
+                            "my_one_arg": "$parameter.my_parameter.value[0]",
+                            "meta": {
+                                "details": {
+                                    "my_parameter_estimator": "$parameter.my_parameter.details",
+                                    "note": "Important remarks about estimation algorithm.",
+                                },
+                            },
+                        },
+                        {
+                            "class_name": "DefaultExpectationConfigurationBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
+                            "expectation_type": "expect_column_min_to_be_between",
+                            "column": "$domain.domain_kwargs.column",
+                            "my_another_arg": "$parameter.my_other_parameter.value[0]",
+                            "meta": {
+                                "details": {
+                                    "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
+                                    "note": "Important remarks about estimation algorithm.",
+                                },
+                            },
+                        },
+                    ],
                 },
-            ],
-        },
-    }
-
-    expected_rules: Dict[str, Dict] = {
-        "rule_1": {
-            "domain_builder": {
-                "class_name": "ColumnDomainBuilder",
-                "module_name": "great_expectations.rule_based_profiler.domain_builder.column_domain_builder",
             },
-            "parameter_builders": [
-                {
-                    "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder.numeric_metric_range_multi_batch_parameter_builder",
-                    "name": "my_other_parameter",
-                    "metric_name": "my_other_metric",
-                    "sampling_method": "bootstrap",
-                    "enforce_numeric_metric": True,
-                    "replace_nan_with_zero": True,
-                    "reduce_scalar_metric": True,
-                    "false_positive_rate": 0.05,
-                    "truncate_values": {},
-                    "json_serialize": True,
-                },
-            ],
-            "expectation_configuration_builders": [
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
-                    "expectation_type": "expect_column_min_to_be_between",
-                    "column": "$domain.domain_kwargs.column",
-                    "my_another_arg": "$parameter.my_other_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
+            ReconciliationDirectives(
+                domain_builder=ReconciliationStrategy.UPDATE,
+                parameter_builder=ReconciliationStrategy.UPDATE,
+                expectation_configuration_builder=ReconciliationStrategy.NESTED_UPDATE,
+            ),
+            {
+                "rule_1": {
+                    "domain_builder": _DB_COLUMN,
+                    "parameter_builders": [
+                        _PB_MY_PARAMETER,
+                        _PB_MY_OTHER_PARAMETER,
+                    ],
+                    "expectation_configuration_builders": [
+                        {
+                            **_ECB_PAIR_AB,
+                            "my_one_arg": "$parameter.my_parameter.value[0]",
                         },
-                    },
+                        _ECB_MIN,
+                    ],
                 },
-            ],
-        },
-    }
-
-    effective_rules: List[
-        Rule
-    ] = profiler_with_placeholder_args.reconcile_profiler_rules(
-        rules=rules,
-        reconciliation_directives=ReconciliationDirectives(
-            domain_builder=ReconciliationStrategy.UPDATE,
-            parameter_builder=ReconciliationStrategy.REPLACE,
-            expectation_configuration_builder=ReconciliationStrategy.REPLACE,
-        ),
-    )
-
-    rule: Rule
-    effective_rule_configs_actual: Dict[str, dict] = {
-        rule.name: rule.to_json_dict() for rule in effective_rules
-    }
-    deep_filter_properties_iterable(effective_rule_configs_actual, inplace=True)
-
-    assert effective_rule_configs_actual == expected_rules
-
-
-def test_reconcile_profiler_rules_existing_rule_full_rule_override_update(
-    profiler_with_placeholder_args,
-):
-    rules: Dict[str, Dict[str, Any]] = {
-        "rule_1": {
-            "domain_builder": {
-                "class_name": "ColumnDomainBuilder",
-                "module_name": "great_expectations.rule_based_profiler.domain_builder",
             },
-            "parameter_builders": [
-                {
-                    "class_name": "MetricMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder",
-                    "name": "my_parameter",
-                    "metric_name": "my_metric",
-                    "json_serialize": True,
-                },
-                {
-                    "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder",
-                    "name": "my_other_parameter",
-                    "metric_name": "my_other_metric",
-                    "json_serialize": True,
-                },
-            ],
-            "expectation_configuration_builders": [
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
-                    "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
-                    "column_A": "$domain.domain_kwargs.column_A",
-                    "column_B": "$domain.domain_kwargs.column_B",
-                    "my_one_arg": "$parameter.my_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_parameter_estimator": "$parameter.my_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
-                        },
+            id="existing_rule_full_rule_override_nested_update",
+        ),
+        pytest.param(
+            {
+                "rule_1": {
+                    "domain_builder": {
+                        "class_name": "ColumnDomainBuilder",
+                        "module_name": "great_expectations.rule_based_profiler.domain_builder",
                     },
-                },
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
-                    "expectation_type": "expect_column_min_to_be_between",
-                    "column": "$domain.domain_kwargs.column",
-                    "my_another_arg": "$parameter.my_other_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
+                    "parameter_builders": [
+                        {
+                            "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.parameter_builder",
+                            "name": "my_other_parameter",
+                            "metric_name": "my_other_metric",
+                            "json_serialize": True,
                         },
-                    },
+                    ],
+                    "expectation_configuration_builders": [
+                        {
+                            "class_name": "DefaultExpectationConfigurationBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
+                            "expectation_type": "expect_column_min_to_be_between",
+                            "column": "$domain.domain_kwargs.column",
+                            "my_another_arg": "$parameter.my_other_parameter.value[0]",
+                            "meta": {
+                                "details": {
+                                    "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
+                                    "note": "Important remarks about estimation algorithm.",
+                                },
+                            },
+                        },
+                    ],
                 },
-            ],
-        },
-    }
-
-    expected_rules: Dict[str, dict] = {
-        "rule_1": {
-            "domain_builder": {
-                "class_name": "ColumnDomainBuilder",
-                "module_name": "great_expectations.rule_based_profiler.domain_builder.column_domain_builder",
             },
-            "parameter_builders": [
-                {
-                    "class_name": "MetricMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder.metric_multi_batch_parameter_builder",
-                    "name": "my_parameter",
-                    "metric_name": "my_metric",
-                    "enforce_numeric_metric": False,
-                    "replace_nan_with_zero": False,
-                    "reduce_scalar_metric": True,
-                    "json_serialize": True,
-                },
-                {
-                    "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.parameter_builder.numeric_metric_range_multi_batch_parameter_builder",
-                    "name": "my_other_parameter",
-                    "metric_name": "my_other_metric",
-                    "sampling_method": "bootstrap",
-                    "enforce_numeric_metric": True,
-                    "replace_nan_with_zero": True,
-                    "reduce_scalar_metric": True,
-                    "false_positive_rate": 0.05,
-                    "truncate_values": {},
-                    "json_serialize": True,
+            ReconciliationDirectives(
+                domain_builder=ReconciliationStrategy.UPDATE,
+                parameter_builder=ReconciliationStrategy.REPLACE,
+                expectation_configuration_builder=ReconciliationStrategy.REPLACE,
+            ),
+            {
+                "rule_1": {
+                    "domain_builder": _DB_COLUMN,
+                    "parameter_builders": [
+                        _PB_MY_OTHER_PARAMETER,
+                    ],
+                    "expectation_configuration_builders": [
+                        _ECB_MIN,
+                    ],
                 },
-            ],
-            "expectation_configuration_builders": [
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
-                    "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
-                    "column_A": "$domain.domain_kwargs.column_A",
-                    "column_B": "$domain.domain_kwargs.column_B",
-                    "my_one_arg": "$parameter.my_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_parameter_estimator": "$parameter.my_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
-                        },
+            },
+            id="existing_rule_full_rule_override_replace",
+        ),
+        pytest.param(
+            {
+                "rule_1": {
+                    "domain_builder": {
+                        "class_name": "ColumnDomainBuilder",
+                        "module_name": "great_expectations.rule_based_profiler.domain_builder",
                     },
-                },
-                {
-                    "class_name": "DefaultExpectationConfigurationBuilder",
-                    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder.default_expectation_configuration_builder",
-                    "expectation_type": "expect_column_min_to_be_between",
-                    "column": "$domain.domain_kwargs.column",
-                    "my_another_arg": "$parameter.my_other_parameter.value[0]",
-                    "meta": {
-                        "details": {
-                            "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
-                            "note": "Important remarks about estimation algorithm.",
+                    "parameter_builders": [
+                        {
+                            "class_name": "MetricMultiBatchParameterBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.parameter_builder",
+                            "name": "my_parameter",
+                            "metric_name": "my_metric",
+                            "json_serialize": True,
                         },
-                    },
+                        {
+                            "class_name": "NumericMetricRangeMultiBatchParameterBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.parameter_builder",
+                            "name": "my_other_parameter",
+                            "metric_name": "my_other_metric",
+                            "json_serialize": True,
+                        },
+                    ],
+                    "expectation_configuration_builders": [
+                        {
+                            "class_name": "DefaultExpectationConfigurationBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
+                            "expectation_type": "expect_column_pair_values_A_to_be_greater_than_B",
+                            "column_A": "$domain.domain_kwargs.column_A",
+                            "column_B": "$domain.domain_kwargs.column_B",
+                            "my_one_arg": "$parameter.my_parameter.value[0]",
+                            "meta": {
+                                "details": {
+                                    "my_parameter_estimator": "$parameter.my_parameter.details",
+                                    "note": "Important remarks about estimation algorithm.",
+                                },
+                            },
+                        },
+                        {
+                            "class_name": "DefaultExpectationConfigurationBuilder",
+                            "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder",
+                            "expectation_type": "expect_column_min_to_be_between",
+                            "column": "$domain.domain_kwargs.column",
+                            "my_another_arg": "$parameter.my_other_parameter.value[0]",
+                            "meta": {
+                                "details": {
+                                    "my_other_parameter_estimator": "$parameter.my_other_parameter.details",
+                                    "note": "Important remarks about estimation algorithm.",
+                                },
+                            },
+                        },
+                    ],
                 },
-            ],
-        },
-    }
-
+            },
+            RuleBasedProfiler.DEFAULT_RECONCILATION_DIRECTIVES,
+            {
+                "rule_1": {
+                    "domain_builder": _DB_COLUMN,
+                    "parameter_builders": [
+                        _PB_MY_PARAMETER,
+                        _PB_MY_OTHER_PARAMETER,
+                    ],
+                    "expectation_configuration_builders": [
+                        _ECB_PAIR_AB_ONE_ARG,
+                        _ECB_MIN,
+                    ],
+                },
+            },
+            id="existing_rule_full_rule_override_update",
+        ),
+    ],
+)
+def test_reconcile_profiler_rules_with_overrides(
+    profiler_with_placeholder_args,
+    rules: Dict[str, Dict[str, Any]],
+    reconciliation_directives: ReconciliationDirectives,
+    expected_rules: Dict[str, dict],
+):
     effective_rules: List[
         Rule
-    ] = profiler_with_placeholder_args.reconcile_profiler_rules(rules=rules)
+    ] = profiler_with_placeholder_args.reconcile_profiler_rules(
+        rules=rules,
+        reconciliation_directives=reconciliation_directives,
+    )
 
     rule: Rule
     effective_rule_configs_actual: Dict[str, dict] = {
@@ -1274,7 +1004,7 @@ def test_add_single_rule(
         domain_builder=mock_domain_builder,
         expectation_configuration_builders=mock_expectation_configuration_builder,
     )
-    first_rule.to_json_dict = MagicMock(return_value=sample_rule_dict)
+    first_rule.to_json_dict = lambda: sample_rule_dict
     profiler.add_rule(rule=first_rule)
     assert len(profiler.rules) == 1
 
@@ -1283,7 +1013,7 @@ def test_add_single_rule(
         domain_builder=mock_domain_builder,
         expectation_configuration_builders=mock_expectation_configuration_builder,
     )
-    duplicate_of_first_rule.to_json_dict = MagicMock(return_value=sample_rule_dict)
+    duplicate_of_first_rule.to_json_dict = lambda: sample_rule_dict
     profiler.add_rule(rule=duplicate_of_first_rule)
     assert len(profiler.rules) == 1
 
@@ -1312,7 +1042,7 @@ def test_add_rule_overwrite_first_rule(
         domain_builder=mock_domain_builder,
         expectation_configuration_builders=mock_expectation_configuration_builder,
     )
-    first_rule.to_json_dict = MagicMock(return_value=sample_rule_dict)
+    first_rule.to_json_dict = lambda: sample_rule_dict
     profiler.add_rule(rule=first_rule)
     assert len(profiler.rules) == 1
 
@@ -1340,7 +1070,7 @@ def test_add_rule_add_second_rule(
         domain_builder=mock_domain_builder,
         expectation_configuration_builders=mock_expectation_configuration_builder,
     )
-    first_rule.to_json_dict = MagicMock(return_value=sample_rule_dict)
+    first_rule.to_json_dict = lambda: sample_rule_dict
     profiler.add_rule(rule=first_rule)
     assert len(profiler.rules) == 1
 
@@ -1349,7 +1079,7 @@ def test_add_rule_add_second_rule(
         domain_builder=mock_domain_builder,
         expectation_configuration_builders=mock_expectation_configuration_builder,
     )
-    second_rule.to_json_dict = MagicMock(return_value=sample_rule_dict)
+    second_rule.to_json_dict = lambda: sample_rule_dict
     profiler.add_rule(rule=second_rule)
     assert len(profiler.rules) == 2
 
@@ -1,6 +1,7 @@
 import copy
 import logging
 import os
+from unittest import mock
 
 import pytest
 
@@ -581,6 +582,41 @@ def test_deep_filter_properties_iterable_on_batch_request_dict():
     }
 
 
+def test_deep_filter_properties_iterable_filters_shared_sub_dictionary_once():
+    shared_details: dict = {
+        "note": "Important remarks about estimation algorithm.",
+        "estimator": None,
+        "bounds": {},
+    }
+    source_dict: dict = {
+        "first": {"meta": {"details": shared_details}, "empty_list": []},
+        "second": {"meta": {"details": shared_details}, "null": None},
+    }
+
+    with mock.patch(
+        "great_expectations.util.filter_properties_dict",
+        wraps=filter_properties_dict,
+    ) as mock_filter_properties_dict:
+        deep_filter_properties_iterable(
+            properties=source_dict, clean_falsy=True, inplace=True
+        )
+
+    # Top-level, "first", "second", and two "meta" dictionaries, plus shared "details" dictionary (filtered only once).
+    assert mock_filter_properties_dict.call_count == 6
+    assert source_dict == {
+        "first": {
+            "meta": {
+                "details": {"note": "Important remarks about estimation algorithm."}
+            }
+        },
+        "second": {
+            "meta": {
+                "details": {"note": "Important remarks about estimation algorithm."}
+            }
+        },
+    }
+
+
 def test_hyphen():
     txt: str = "suite_validation_result"
     assert hyphen(txt=txt) == "suite-validation-result"
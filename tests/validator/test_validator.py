@@ -1,3 +1,4 @@
+import copy
 from typing import Any, Dict, List, Set, Tuple, Union
 from unittest import mock
 from uuid import UUID
@@ -29,7 +30,10 @@ from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.core.expect_column_value_z_scores_to_be_less_than import (
     ExpectColumnValueZScoresToBeLessThan,
 )
-from great_expectations.expectations.registry import get_expectation_impl
+from great_expectations.expectations.registry import (
+    get_expectation_impl,
+    get_metric_provider,
+)
 from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metric_configuration import MetricConfiguration
 from great_expectations.validator.validation_graph import MetricEdge, ValidationGraph
@@ -1087,3 +1091,95 @@ def test_validator_docstrings(multi_batch_taxi_validator):
     assert expectation_impl.__doc__.startswith(
         "Expect each column value to be in a given set"
     )
+
+
+def test_get_default_value_kwargs_updates_metric_configuration_id():
+    metric_configuration = MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    assert metric_configuration.id == ("column.value_counts", "column=a", ())
+
+    provider_cls, _ = get_metric_provider(
+        metric_name="column.value_counts", execution_engine=PandasExecutionEngine()
+    )
+    Validator._get_default_value_kwargs(
+        metric_provider_cls=provider_cls,
+        metric_configuration=metric_configuration,
+    )
+
+    assert metric_configuration.metric_value_kwargs == {
+        "sort": "value",
+        "collate": None,
+    }
+    assert (
+        metric_configuration.id[2]
+        == IDDict(metric_configuration.metric_value_kwargs).to_id()
+    )
+
+
+def test_metric_configuration_id_reflects_in_place_modified_metric_kwargs():
+    metric_configuration = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={"table": "my_table"},
+        metric_value_kwargs=None,
+    )
+    assert metric_configuration.id == ("table.row_count", "table=my_table", ())
+
+    metric_configuration_copy: MetricConfiguration = copy.deepcopy(metric_configuration)
+    metric_configuration_copy.metric_domain_kwargs["table"] = "other_table"
+    assert metric_configuration_copy.id == ("table.row_count", "table=other_table", ())
+    assert metric_configuration.id == ("table.row_count", "table=my_table", ())
+
+    metric_configuration.metric_domain_kwargs.update({"table": "another_table"})
+    assert metric_configuration.id == ("table.row_count", "table=another_table", ())
+
+    metric_configuration.metric_value_kwargs.setdefault("include_nested", True)
+    assert metric_configuration.id == (
+        "table.row_count",
+        "table=another_table",
+        "include_nested=True",
+    )
+
+    metric_configuration.metric_value_kwargs.pop("include_nested")
+    assert metric_configuration.id == ("table.row_count", "table=another_table", ())
+
+
+@pytest.mark.parametrize(
+    "expectation_configuration",
+    [
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_equal_other_table",
+            kwargs={"other_table_name": "other_table"},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_quantile_values_to_be_between",
+            kwargs={
+                "column": "a",
+                "quantile_ranges": {
+                    "quantiles": [0.5],
+                    "value_ranges": [[0, 1]],
+                },
+            },
+        ),
+    ],
+)
+def test_validation_dependencies_metric_configuration_ids_reflect_metric_kwargs(
+    expectation_configuration,
+):
+    expectation_impl = get_expectation_impl(
+        expectation_name=expectation_configuration.expectation_type
+    )
+    validation_dependencies: dict = expectation_impl().get_validation_dependencies(
+        configuration=expectation_configuration,
+        execution_engine=PandasExecutionEngine(),
+    )
+
+    metric_configuration: MetricConfiguration
+    for metric_configuration in validation_dependencies["metrics"].values():
+        assert metric_configuration.id == (
+            metric_configuration.metric_name,
+            IDDict(metric_configuration.metric_domain_kwargs).to_id(),
+            IDDict(metric_configuration.metric_value_kwargs).to_id(),
+        )